@@ -4,15 +4,53 @@ Analyze sentiment of blog posts using TextBlob.
 Updates mood data with sentiment scores.
 """
 
-import json
+import atexit
+import os
+from hashlib import blake2b
 from pathlib import Path
 
-from textblob import TextBlob
+import orjson
+from textblob.en import polarity
+
+# Scores keyed by text hash, persisted so reruns skip unchanged posts
+SENTIMENT_CACHE_PATH = Path(__file__).parent.parent / "data" / "mood" / ".sentiment_cache.json"
+
+def load_sentiment_cache():
+    """Load cached sentiment scores, or an empty cache if none exists."""
+    try:
+        return orjson.loads(SENTIMENT_CACHE_PATH.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+# Scores saved by the last run, and the scores looked up in this one. Only
+# this run's are saved, so texts that are no longer scored drop out.
+_saved_sentiment_scores = load_sentiment_cache()
+_sentiment_cache = {}
+
+def save_sentiment_cache():
+    """Write this run's sentiment scores to disk if they differ from the saved ones."""
+    if not _sentiment_cache or _sentiment_cache == _saved_sentiment_scores:
+        return
+    SENTIMENT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SENTIMENT_CACHE_PATH.write_bytes(orjson.dumps(_sentiment_cache))
+
+atexit.register(save_sentiment_cache)
 
 def analyze_sentiment(text):
-    """Analyze sentiment of text and return polarity score."""
-    blob = TextBlob(text)
-    return blob.sentiment.polarity
+    """Analyze sentiment of text and return polarity score.
+
+    Scores against TextBlob's lexicon directly; building a TextBlob
+    per post gives the same polarity at several times the cost.
+    Unchanged posts are served from the on-disk cache.
+    """
+    key = blake2b(text.encode(), digest_size=16).hexdigest()
+    score = _sentiment_cache.get(key)
+    if score is None:
+        score = _saved_sentiment_scores.get(key)
+        if score is None:
+            score = polarity(text)
+        _sentiment_cache[key] = score
+    return score
 
 def get_mood_label(score):
     """Map sentiment score to mood label."""
@@ -26,41 +64,58 @@ def get_mood_label(score):
 def update_mood_file(filepath):
     """Update a mood file with sentiment analysis."""
     try:
-        with open(filepath) as f:
-            data = json.load(f)
+        data = orjson.loads(filepath.read_bytes())
 
         if not data.get("posts"):
             print(f"No posts to analyze in {filepath.name}")
             return
 
-        # Analyze each post
+        company = data.get("company", filepath.stem)
+
+        # Analyze each post, noting whether any score differs from the file
         scores = []
+        posts_changed = False
         for post in data["posts"]:
             text = f"{post.get('title', '')} {post.get('summary', '')}"
             if text.strip():
-                score = analyze_sentiment(text)
-                post["sentiment"] = round(score, 3)
-                scores.append(score)
+                post_score = analyze_sentiment(text)
+                post_sentiment = round(post_score, 3)
+                if post.get("sentiment") != post_sentiment:
+                    posts_changed = True
+                post["sentiment"] = post_sentiment
+                scores.append(post_score)
+
+        if not scores:
+            print(f"Unchanged {company}")
+            return
 
         # Calculate average sentiment
-        if scores:
-            avg_score = sum(scores) / len(scores)
-            data["sentiment"] = {
-                "score": round(avg_score, 3),
-                "label": get_mood_label(avg_score),
-            }
-
-            # Update history (keep last 30 data points)
-            history = data.get("history", [])
-            history.append(round(avg_score, 3))
-            data["history"] = history[-30:]
-
-        # Save updated data
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        avg_score = sum(scores) / len(scores)
+        avg_sentiment = {
+            "score": round(avg_score, 3),
+            "label": get_mood_label(avg_score),
+        }
+
+        # Skip the write if every post and the average scored as before;
+        # appending to history would only repeat the last data point
+        if not posts_changed and data.get("sentiment") == avg_sentiment:
+            print(f"Unchanged {company}")
+            return
 
-        company = data.get("company", filepath.stem)
-        print(f"Updated {company}: score={data['sentiment']['score']:.3f}, label={data['sentiment']['label']}")
+        data["sentiment"] = avg_sentiment
+
+        # Update history (keep last 30 data points)
+        history = data.get("history", [])
+        history.append(avg_sentiment["score"])
+        data["history"] = history[-30:]
+
+        # Write to a temp file and rename over the original so readers
+        # never see a half-written file
+        tmp_path = filepath.with_suffix(".json.tmp")
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, filepath)
+
+        print(f"Updated {company}: score={avg_sentiment['score']:.3f}, label={avg_sentiment['label']}")
 
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
@@ -77,6 +132,9 @@ def main():
     print("Analyzing sentiment...")
 
     for filepath in mood_dir.glob("*.json"):
+        # Skip hidden files such as the sentiment cache
+        if filepath.name.startswith("."):
+            continue
         update_mood_file(filepath)
 
     print("Sentiment analysis complete!")
@@ -5,21 +5,34 @@ Populates 30-90 days of REAL historical data for stocks, mood, and pulse.
 All data is derived from real sources - no synthetic data.
 """
 
-import json
+import atexit
 import re
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from hashlib import blake2b
 from pathlib import Path
 
 import feedparser
+import numpy as np
+import orjson
 import requests
 import yfinance as yf
-from bs4 import BeautifulSoup
-from textblob import TextBlob
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from textblob.en import polarity
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; AI-Weather-Report/1.0)"
 }
 
+# Sources are fetched concurrently; the work is network-bound, not CPU-bound
+MAX_WORKERS = 8
+
+# Shared session so worker threads reuse TCP/TLS connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 # =============================================================================
 # Stock Data (already real - uses yfinance)
 # =============================================================================
@@ -36,12 +49,18 @@ def backfill_stocks():
         "NVDA": "NVIDIA",
     }
 
+    # One batched request for all tickers instead of one per ticker
+    try:
+        data = yf.download(list(tickers), period="3mo", group_by="ticker", threads=True, progress=False)  # 90 days
+    except Exception as e:
+        print(f"  Error fetching stock data: {e}")
+        return []
+
     stocks = []
 
     for ticker, name in tickers.items():
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="3mo")  # 90 days
+            hist = data[ticker].dropna(how="all")
 
             if hist.empty:
                 print(f"  Warning: No historical data for {ticker}")
@@ -92,12 +111,112 @@ RSS_SOURCES = {
     },
 }
 
+# Scores keyed by text hash, persisted so reruns skip unchanged posts. Kept
+# apart from analyze-sentiment.py's cache, as each script saves only its own.
+SENTIMENT_CACHE_PATH = Path(__file__).parent.parent / "data" / "mood" / ".backfill_sentiment_cache.json"
+
+def load_sentiment_cache():
+    """Load cached sentiment scores, or an empty cache if none exists."""
+    try:
+        return orjson.loads(SENTIMENT_CACHE_PATH.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+# Scores saved by the last run, and the scores looked up in this one. Only
+# this run's are saved, so texts that are no longer scored drop out.
+_saved_sentiment_scores = load_sentiment_cache()
+_sentiment_cache = {}
+
+def save_sentiment_cache():
+    """Write this run's sentiment scores to disk if they differ from the saved ones."""
+    if not _sentiment_cache or _sentiment_cache == _saved_sentiment_scores:
+        return
+    SENTIMENT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SENTIMENT_CACHE_PATH.write_bytes(orjson.dumps(_sentiment_cache))
+
+atexit.register(save_sentiment_cache)
+
+def write_json(path, data):
+    """Write data to path as indented JSON.
+
+    Stock prices come back from pandas as numpy floats, hence the numpy option.
+    """
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+# Conditional-GET cache: each URL's ETag / Last-Modified validators and the
+# results parsed from it last run. On a 304 the parsed results are reused, so
+# an unchanged page is neither downloaded nor parsed again. fetch-changelogs.py
+# and fetch-feeds.py keep their own caches with this same code.
+HTTP_CACHE_PATH = Path(__file__).parent.parent / "data" / ".http_cache.json"
+
+def load_http_cache():
+    """Load cached HTTP validators and parsed results, or an empty cache if none exists."""
+    try:
+        return orjson.loads(HTTP_CACHE_PATH.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+_http_cache = load_http_cache()
+_http_cache_dirty = False
+
+def save_http_cache():
+    """Write the HTTP cache back to disk if any entry changed."""
+    if not _http_cache_dirty:
+        return
+    HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    HTTP_CACHE_PATH.write_bytes(orjson.dumps(_http_cache))
+
+atexit.register(save_http_cache)
+
+def fetch_cached(url, parse):
+    """Fetch url and return parse(response), reusing the cached records on a 304."""
+    global _http_cache_dirty
+    cached = _http_cache.get(url)
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = SESSION.get(url, headers=headers, timeout=30)
+    if response.status_code == 304 and cached:
+        return [
+            {**record, "datetime": datetime.fromisoformat(record["datetime"]) if record["datetime"] else None}
+            for record in cached["records"]
+        ]
+    response.raise_for_status()
+
+    records = parse(response)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _http_cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "records": [
+                {**record, "datetime": record["datetime"].isoformat() if record["datetime"] else None}
+                for record in records
+            ],
+        }
+        _http_cache_dirty = True
+
+    return records
+
 def analyze_sentiment(text):
-    """Analyze sentiment of text using TextBlob."""
+    """Analyze sentiment of text using TextBlob's pattern lexicon."""
     if not text or not text.strip():
         return 0.0
-    blob = TextBlob(text)
-    return blob.sentiment.polarity
+
+    key = blake2b(text.encode(), digest_size=16).hexdigest()
+    score = _sentiment_cache.get(key)
+    if score is None:
+        score = _saved_sentiment_scores.get(key)
+        if score is None:
+            score = polarity(text)
+        _sentiment_cache[key] = score
+    return score
 
 def get_mood_label(score):
     """Map sentiment score to mood label."""
@@ -108,38 +227,84 @@ def get_mood_label(score):
     else:
         return "cautious"
 
+# Supported date shapes, so parse_date makes exactly one strptime call
+ISO_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:T(\d{2}:\d{2}:\d{2}))?")
+MONTH_FIRST_DATE_RE = re.compile(r"^([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})$")
+DAY_FIRST_DATE_RE = re.compile(r"^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$")
+
 def parse_date(date_str):
-    """Try to parse a date string in various formats."""
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%d %B %Y",
-        "%d %b %Y",
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str.strip()[:19], fmt[:len(date_str.strip())])
-        except ValueError:
-            continue
+    """Parse an ISO, "Month DD, YYYY" or "DD Month YYYY" date string.
+
+    Returns a naive datetime, or None if the string isn't a known format.
+    """
+    date_str = date_str.strip()
+
+    try:
+        match = ISO_DATE_RE.match(date_str)
+        if match:
+            # Well-formed ISO strings parse in C; drop any offset to stay naive
+            try:
+                return datetime.fromisoformat(date_str.replace("Z", "+00:00")).replace(tzinfo=None)
+            except ValueError:
+                pass
+
+            day, time = match.groups()
+            if time:
+                return datetime.strptime(f"{day}T{time}", "%Y-%m-%dT%H:%M:%S")
+            return datetime.strptime(day, "%Y-%m-%d")
+
+        match = MONTH_FIRST_DATE_RE.match(date_str)
+        if match:
+            month, day, year = match.groups()
+            month_fmt = "%b" if len(month) == 3 else "%B"
+            return datetime.strptime(f"{month} {day} {year}", f"{month_fmt} %d %Y")
+
+        match = DAY_FIRST_DATE_RE.match(date_str)
+        if match:
+            day, month, year = match.groups()
+            month_fmt = "%b" if len(month) == 3 else "%B"
+            return datetime.strptime(f"{day} {month} {year}", f"%d {month_fmt} %Y")
+    except ValueError:
+        pass
+
     return None
 
+def compile_keywords(keywords):
+    """Compile a keyword list into one regex matching any of them as a substring."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
 def fetch_rss_posts_with_dates(source):
     """Fetch all posts from RSS feed with dates and sentiment."""
     posts = []
+
+    # All keywords in one pattern so each post is scanned once
+    keyword_re = None
+    if "filter_keywords" in source:
+        keyword_re = compile_keywords(source["filter_keywords"])
+
     try:
-        feed = feedparser.parse(source["url"])
+        # Fetch through the shared session; only title, summary, link and
+        # dates are used, so skip feedparser's HTML sanitizing and rewriting
+        response = SESSION.get(source["url"], timeout=30)
+        response.raise_for_status()
+        feed = feedparser.parse(
+            response.content,
+            response_headers={
+                "content-type": response.headers.get("Content-Type", ""),
+                "content-location": response.url,
+            },
+            sanitize_html=False,
+            resolve_relative_uris=False,
+        )
 
         for entry in feed.entries[:50]:  # Get up to 50 entries for history
             title = entry.get("title", "")
             summary = entry.get("summary", "")
 
             # Apply keyword filter if specified
-            if "filter_keywords" in source:
+            if keyword_re:
                 combined = (title + " " + summary).lower()
-                if not any(kw in combined for kw in source["filter_keywords"]):
+                if not keyword_re.search(combined):
                     continue
 
             # Parse date
@@ -154,11 +319,11 @@ def fetch_rss_posts_with_dates(source):
                 text = f"{title} {summary}"
                 sentiment = analyze_sentiment(text)
 
+                # The summary only feeds the sentiment score, so it isn't kept
                 posts.append({
                     "title": title,
                     "date": date.strftime("%Y-%m-%d"),
                     "url": entry.get("link", ""),
-                    "summary": summary[:500],
                     "sentiment": round(sentiment, 3),
                     "datetime": date,
                 })
@@ -169,71 +334,120 @@ def fetch_rss_posts_with_dates(source):
 
     return posts
 
+# Article links on the Anthropic news page, and dates embedded in their URLs
+NEWS_HREF_RE = re.compile(r"/news/")
+URL_DATE_RE = re.compile(r"(\d{4})[/-](\d{2})[/-](\d{2})")
+
 def scrape_anthropic_posts():
     """Scrape Anthropic news with dates and sentiment."""
     posts = []
     url = "https://www.anthropic.com/news"
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        posts = fetch_cached(url, parse_anthropic_posts)
+        print(f"  Scraped {len(posts)} posts from Anthropic")
+    except Exception as e:
+        print(f"  Error scraping Anthropic: {e}")
 
-        # Find article links
-        articles = soup.find_all("a", href=re.compile(r"/news/"))
-        seen_urls = set()
+    return posts
 
-        for article in articles:
-            href = article.get("href", "")
-            if href in seen_urls or not href.startswith("/news/"):
-                continue
-            seen_urls.add(href)
+def parse_anthropic_posts(response):
+    """Parse posts with dates and sentiment from the Anthropic news page."""
+    posts = []
+    soup = BeautifulSoup(response.content, "lxml")
 
-            # Try to find title
-            title_elem = article.find(["h2", "h3", "h4"]) or article
-            title = title_elem.get_text(strip=True) if title_elem else ""
+    # Find article links
+    articles = soup.find_all("a", href=NEWS_HREF_RE)
+    seen_urls = set()
 
-            if not title or len(title) < 5:
-                continue
+    for article in articles:
+        href = article.get("href", "")
+        if href in seen_urls or not href.startswith("/news/"):
+            continue
+        seen_urls.add(href)
 
-            # Try to find date
-            date_elem = article.find_parent().find("time") if article.find_parent() else None
-            date = None
-            if date_elem:
-                date_text = date_elem.get("datetime") or date_elem.get_text(strip=True)
-                date = parse_date(date_text)
-
-            # If no date found, try to extract from URL or use None
-            if not date:
-                # Anthropic URLs sometimes have dates
-                date_match = re.search(r"(\d{4})[/-](\d{2})[/-](\d{2})", href)
-                if date_match:
-                    try:
-                        date = datetime(int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3)))
-                    except ValueError:
-                        pass
-
-            link_url = f"https://www.anthropic.com{href}"
-            sentiment = analyze_sentiment(title)
+        # Try to find title
+        title_elem = article.find(["h2", "h3", "h4"]) or article
+        title = title_elem.get_text(strip=True) if title_elem else ""
+
+        if not title or len(title) < 5:
+            continue
+
+        # Try to find date
+        date_elem = article.find_parent().find("time") if article.find_parent() else None
+        date = None
+        if date_elem:
+            date_text = date_elem.get("datetime") or date_elem.get_text(strip=True)
+            date = parse_date(date_text)
+
+        # If no date found, try to extract from URL or use None
+        if not date:
+            # Anthropic URLs sometimes have dates
+            date_match = URL_DATE_RE.search(href)
+            if date_match:
+                try:
+                    date = datetime(int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3)))
+                except ValueError:
+                    pass
+
+        link_url = f"https://www.anthropic.com{href}"
+        sentiment = analyze_sentiment(title)
+
+        posts.append({
+            "title": title,
+            "date": date.strftime("%Y-%m-%d") if date else "",
+            "url": link_url,
+            "sentiment": round(sentiment, 3),
+            "datetime": date,
+        })
 
+        if len(posts) >= 30:
+            break
+
+    return posts
+
+BLOG_HREF_RE = re.compile(r"/blog/")
+
+def scrape_meta_ai_posts():
+    """Scrape additional posts from the Meta AI blog."""
+    posts = []
+
+    try:
+        posts = fetch_cached("https://ai.meta.com/blog/", parse_meta_ai_posts)
+        print(f"  Added {len(posts)} posts from Meta AI blog")
+    except Exception as e:
+        print(f"  Error scraping Meta AI blog: {e}")
+
+    return posts
+
+def parse_meta_ai_posts(response):
+    """Parse posts with sentiment from the Meta AI blog page."""
+    posts = []
+
+    # Only the blog links are needed, so build a tree of just those
+    soup = BeautifulSoup(response.content, "lxml", parse_only=SoupStrainer("a", href=BLOG_HREF_RE))
+
+    for link in soup.find_all("a"):
+        title = link.get_text(strip=True)
+        if title and len(title) > 5:
+            sentiment = analyze_sentiment(title)
             posts.append({
                 "title": title,
-                "date": date.strftime("%Y-%m-%d") if date else "",
-                "url": link_url,
-                "summary": "",
+                "date": "",
+                "url": f"https://ai.meta.com{link.get('href', '')}",
                 "sentiment": round(sentiment, 3),
-                "datetime": date,
+                "datetime": None,
             })
-
-            if len(posts) >= 30:
+            if len(posts) >= 20:
                 break
 
-        print(f"  Scraped {len(posts)} posts from Anthropic")
-    except Exception as e:
-        print(f"  Error scraping Anthropic: {e}")
-
     return posts
 
+# Naive datetimes become seconds since a naive epoch for numpy window searches,
+# which keeps the same ordering and day arithmetic as the datetimes themselves
+EPOCH = datetime(1970, 1, 1)
+SECONDS_PER_DAY = 24 * 60 * 60
+
 def build_mood_history(posts, days=30):
     """Build a rolling sentiment history from real posts.
 
@@ -250,35 +464,36 @@ def build_mood_history(posts, days=30):
         avg = sum(p.get("sentiment", 0) for p in posts) / len(posts)
         return [round(avg, 3)] * min(7, days)
 
-    dated_posts.sort(key=lambda x: x["datetime"])
-
-    today = datetime.now()
-    history = []
-
-    for day_offset in range(days - 1, -1, -1):
-        target_date = today - timedelta(days=day_offset)
-
-        # Get posts from the previous 7 days up to target_date
-        window_start = target_date - timedelta(days=7)
-
-        window_posts = [
-            p for p in dated_posts
-            if p["datetime"] and window_start <= p["datetime"] <= target_date
-        ]
+    timestamps = np.array([(p["datetime"] - EPOCH).total_seconds() for p in dated_posts])
+    order = timestamps.argsort(kind="stable")
+    timestamps = timestamps[order]
+    sentiments = [dated_posts[i].get("sentiment", 0) for i in order.tolist()]
+
+    # One target per day, oldest first; each window covers the preceding 7 days
+    today = (datetime.now() - EPOCH).total_seconds()
+    targets = today - np.arange(days - 1, -1, -1) * SECONDS_PER_DAY
+    window_end = np.searchsorted(timestamps, targets, side="right")
+    window_start = np.searchsorted(timestamps, targets - 7 * SECONDS_PER_DAY, side="left")
+    counts = window_end - window_start
+
+    # Sum each window's posts in date order rather than differencing a
+    # running total, which would drift in the last rounded digit
+    averages = [
+        sum(sentiments[start:end]) / (end - start) if end > start else 0.0
+        for start, end in zip(window_start.tolist(), window_end.tolist())
+    ]
 
-        if window_posts:
-            avg_sentiment = sum(p.get("sentiment", 0) for p in window_posts) / len(window_posts)
-        else:
-            # Use the most recent known sentiment or neutral
-            if history:
-                avg_sentiment = history[-1]
-            else:
-                # Use overall average
-                avg_sentiment = sum(p.get("sentiment", 0) for p in dated_posts) / len(dated_posts)
+    # Days without posts carry the most recent known sentiment forward,
+    # falling back to the overall average before the first window with posts
+    overall = sum(sentiments) / len(sentiments)
+    values = np.array([overall] + averages)
+    has_posts = np.concatenate(([True], counts > 0))
+    last_known = np.maximum.accumulate(np.where(has_posts, np.arange(days + 1), 0))
 
-        history.append(round(avg_sentiment, 3))
+    return [round(v, 3) for v in values[last_known][1:].tolist()]
 
-    return history
+# Fields written out for each post; datetime is only used in-process
+POST_OUTPUT_KEYS = ("title", "date", "url", "sentiment")
 
 def backfill_mood():
     """Backfill mood history with real sentiment data from blog posts."""
@@ -288,40 +503,22 @@ def backfill_mood():
     mood_dir = script_dir / "data" / "mood"
     mood_dir.mkdir(parents=True, exist_ok=True)
 
-    # Fetch real posts for each company
-    company_posts = {}
+    # Fetch real posts for each company, all sources in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # RSS sources
+        rss_results = executor.map(fetch_rss_posts_with_dates, RSS_SOURCES.values())
 
-    # RSS sources
-    for company_id, source in RSS_SOURCES.items():
-        company_posts[company_id] = fetch_rss_posts_with_dates(source)
+        # Anthropic (scraped)
+        anthropic_future = executor.submit(scrape_anthropic_posts)
 
-    # Anthropic (scraped)
-    company_posts["anthropic"] = scrape_anthropic_posts()
+        # Also scrape Meta AI blog for additional posts
+        meta_ai_future = executor.submit(scrape_meta_ai_posts)
 
-    # Also scrape Meta AI blog for additional posts
-    try:
-        response = requests.get("https://ai.meta.com/blog/", headers=HEADERS, timeout=30)
-        if response.ok:
-            soup = BeautifulSoup(response.text, "html.parser")
-            meta_ai_posts = []
-            for link in soup.find_all("a", href=re.compile(r"/blog/")):
-                title = link.get_text(strip=True)
-                if title and len(title) > 5:
-                    sentiment = analyze_sentiment(title)
-                    meta_ai_posts.append({
-                        "title": title,
-                        "date": "",
-                        "url": f"https://ai.meta.com{link.get('href', '')}",
-                        "sentiment": round(sentiment, 3),
-                        "datetime": None,
-                    })
-                    if len(meta_ai_posts) >= 20:
-                        break
-            # Merge with existing Meta posts
-            company_posts["meta"].extend(meta_ai_posts)
-            print(f"  Added {len(meta_ai_posts)} posts from Meta AI blog")
-    except Exception as e:
-        print(f"  Error scraping Meta AI blog: {e}")
+        company_posts = dict(zip(RSS_SOURCES, rss_results))
+        company_posts["anthropic"] = anthropic_future.result()
+
+        # Merge with existing Meta posts
+        company_posts["meta"].extend(meta_ai_future.result())
 
     # Save mood data for each company
     company_names = {
@@ -333,6 +530,7 @@ def backfill_mood():
 
     for company_id, posts in company_posts.items():
         filepath = mood_dir / f"{company_id}.json"
+        name = company_names.get(company_id, company_id)
 
         # Build real history from posts
         history = build_mood_history(posts, days=30)
@@ -345,17 +543,10 @@ def backfill_mood():
             avg_score = 0.0
 
         # Prepare posts for output (remove datetime field)
-        output_posts = []
-        for p in posts[:10]:
-            output_posts.append({
-                "title": p["title"],
-                "date": p["date"],
-                "url": p["url"],
-                "sentiment": p.get("sentiment", 0),
-            })
+        output_posts = [{key: p[key] for key in POST_OUTPUT_KEYS} for p in posts[:10]]
 
         data = {
-            "company": company_names.get(company_id, company_id),
+            "company": name,
             "lastUpdated": datetime.utcnow().isoformat() + "Z",
             "sentiment": {
                 "score": round(avg_score, 3),
@@ -365,10 +556,9 @@ def backfill_mood():
             "history": history,
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json(filepath, data)
 
-        print(f"  Saved {company_names.get(company_id, company_id)}: {len(history)} days of history, {len(output_posts)} posts")
+        print(f"  Saved {name}: {len(history)} days of history, {len(output_posts)} posts")
 
 # =============================================================================
 # Pulse Data - Calculate real weekly activity from changelog entries
@@ -389,67 +579,76 @@ CHANGELOG_SOURCES = {
     },
 }
 
+# Release categories in priority order; anything unmatched is a "feature"
+RELEASE_CATEGORY_PATTERNS = [
+    ("major", compile_keywords(["major", "launch", "release", "new model", "introducing"])),
+    ("deprecation", compile_keywords(["deprecat", "sunset", "removing", "end of"])),
+    ("fix", compile_keywords(["fix", "bug", "patch", "issue", "resolve"])),
+]
+
 def categorize_release(title):
     """Categorize a release based on its title."""
     title_lower = title.lower()
-    if any(kw in title_lower for kw in ["major", "launch", "release", "new model", "introducing"]):
-        return "major"
-    elif any(kw in title_lower for kw in ["deprecat", "sunset", "removing", "end of"]):
-        return "deprecation"
-    elif any(kw in title_lower for kw in ["fix", "bug", "patch", "issue", "resolve"]):
-        return "fix"
-    else:
-        return "feature"
+    for category, pattern in RELEASE_CATEGORY_PATTERNS:
+        if pattern.search(title_lower):
+            return category
+    return "feature"
+
+# ISO or "Month DD, YYYY" dates in changelog headings, and the same date
+# with its leading dash for stripping it out of the title
+HEADING_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2}|[A-Z][a-z]+ \d{1,2}, \d{4})\b")
+HEADING_DATE_SUFFIX_RE = re.compile(r"\s*[-–]\s*(?:\d{4}-\d{2}-\d{2}|[A-Z][a-z]+ \d{1,2}, \d{4})")
 
 def scrape_changelog_entries(source):
     """Scrape changelog entries with dates."""
     releases = []
 
     try:
-        response = requests.get(source["url"], headers=HEADERS, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        releases = fetch_cached(source["url"], parse_changelog_entries)
+        print(f"  Scraped {len(releases)} releases from {source['name']}")
+    except Exception as e:
+        print(f"  Error scraping {source['name']} changelog: {e}")
 
-        # Look for headings with dates
-        headings = soup.find_all(["h2", "h3", "h4"])
+    return releases
 
-        for heading in headings:
-            text = heading.get_text(strip=True)
+def parse_changelog_entries(response):
+    """Parse dated release entries from a changelog page."""
+    releases = []
+    soup = BeautifulSoup(response.content, "lxml")
 
-            # Look for date patterns
-            date_match = re.search(r"\b(\d{4}-\d{2}-\d{2})\b", text)
-            if not date_match:
-                date_match = re.search(r"\b([A-Z][a-z]+ \d{1,2}, \d{4})\b", text)
+    # Look for headings with dates
+    headings = soup.find_all(["h2", "h3", "h4"])
 
-            if date_match:
-                date_str = date_match.group(1)
-                date = parse_date(date_str)
-
-                # Get title (remove date from text)
-                title = re.sub(r"\s*[-–]\s*\d{4}-\d{2}-\d{2}", "", text).strip()
-                title = re.sub(r"\s*[-–]\s*[A-Z][a-z]+ \d{1,2}, \d{4}", "", title).strip()
-
-                if not title:
-                    # Try to get content from next element
-                    next_elem = heading.find_next_sibling()
-                    if next_elem:
-                        li = next_elem.find("li")
-                        if li:
-                            title = li.get_text(strip=True)[:100]
-                        else:
-                            title = next_elem.get_text(strip=True)[:100]
-
-                if title and date:
-                    releases.append({
-                        "date": date.strftime("%Y-%m-%d"),
-                        "type": categorize_release(title),
-                        "title": title[:100],
-                        "datetime": date,
-                    })
+    for heading in headings:
+        text = heading.get_text(strip=True)
 
-        print(f"  Scraped {len(releases)} releases from {source['name']}")
-    except Exception as e:
-        print(f"  Error scraping {source['name']} changelog: {e}")
+        # Look for date patterns
+        date_match = HEADING_DATE_RE.search(text)
+
+        if date_match:
+            date_str = date_match.group(1)
+            date = parse_date(date_str)
+
+            # Get title (remove date from text)
+            title = HEADING_DATE_SUFFIX_RE.sub("", text).strip()
+
+            if not title:
+                # Try to get content from next element
+                next_elem = heading.find_next_sibling()
+                if next_elem:
+                    li = next_elem.find("li")
+                    if li:
+                        title = li.get_text(strip=True)[:100]
+                    else:
+                        title = next_elem.get_text(strip=True)[:100]
+
+            if title and date:
+                releases.append({
+                    "date": date.strftime("%Y-%m-%d"),
+                    "type": categorize_release(title),
+                    "title": title[:100],
+                    "datetime": date,
+                })
 
     return releases
 
@@ -459,7 +658,7 @@ def fetch_github_releases():
     url = "https://api.github.com/repos/meta-llama/llama-models/releases"
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -484,23 +683,18 @@ def fetch_github_releases():
 
 def calculate_real_activity(releases, weeks=14):
     """Calculate real weekly activity counts from releases with dates."""
-    activity = []
-    today = datetime.now()
+    timestamps = np.sort([(r["datetime"] - EPOCH).total_seconds() for r in releases if r.get("datetime")])
+    today = (datetime.now() - EPOCH).total_seconds()
 
-    # Count releases per week for last N weeks
-    for week in range(weeks - 1, -1, -1):
-        week_end = today - timedelta(days=week * 7)
-        week_start = week_end - timedelta(days=7)
+    # Week boundaries for the last N weeks, oldest first; week i covers
+    # [boundaries[i], boundaries[i + 1])
+    boundaries = today - np.arange(weeks, -1, -1) * 7 * SECONDS_PER_DAY
+    counts = np.diff(np.searchsorted(timestamps, boundaries, side="left"))
 
-        count = 0
-        for release in releases:
-            if release.get("datetime"):
-                if week_start <= release["datetime"] < week_end:
-                    count += 1
+    return counts.tolist()
 
-        activity.append(count)
-
-    return activity
+# Fields written out for each release
+RELEASE_OUTPUT_KEYS = ("date", "type", "title")
 
 def backfill_pulse():
     """Backfill pulse activity data from real changelog entries."""
@@ -512,21 +706,22 @@ def backfill_pulse():
 
     companies = {}
 
-    # Scrape changelogs
+    # Scrape changelogs and fetch Meta's GitHub releases in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        changelog_results = executor.map(scrape_changelog_entries, CHANGELOG_SOURCES.values())
+        meta_future = executor.submit(fetch_github_releases)
+
+        changelog_releases = dict(zip(CHANGELOG_SOURCES, changelog_results))
+        meta_releases = meta_future.result()
+
     for company_id, source in CHANGELOG_SOURCES.items():
-        releases = scrape_changelog_entries(source)
+        releases = changelog_releases[company_id]
 
         # Calculate real weekly activity
         activity = calculate_real_activity(releases, weeks=14)
 
         # Prepare releases for output (remove datetime field)
-        output_releases = []
-        for r in releases[:10]:
-            output_releases.append({
-                "date": r["date"],
-                "type": r["type"],
-                "title": r["title"],
-            })
+        output_releases = [{key: r[key] for key in RELEASE_OUTPUT_KEYS} for r in releases[:10]]
 
         companies[company_id] = {
             "name": source["name"],
@@ -537,16 +732,9 @@ def backfill_pulse():
         print(f"  {source['name']}: {len(output_releases)} releases, {sum(activity)} total activity")
 
     # Meta (GitHub releases)
-    meta_releases = fetch_github_releases()
     meta_activity = calculate_real_activity(meta_releases, weeks=14)
 
-    output_meta_releases = []
-    for r in meta_releases[:10]:
-        output_meta_releases.append({
-            "date": r["date"],
-            "type": r["type"],
-            "title": r["title"],
-        })
+    output_meta_releases = [{key: r[key] for key in RELEASE_OUTPUT_KEYS} for r in meta_releases[:10]]
 
     companies["meta"] = {
         "name": "Meta AI",
@@ -561,8 +749,7 @@ def backfill_pulse():
         "companies": companies,
     }
 
-    with open(pulse_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(pulse_path, data)
 
     print(f"Saved pulse data to {pulse_path}")
 
@@ -591,8 +778,7 @@ def main():
             "stocks": stocks,
         }
 
-        with open(stocks_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json(stocks_path, data)
 
         print(f"Saved stock data to {stocks_path}")
 
@@ -5,10 +5,12 @@ Combines signals from mood (sentiment), pulse (shipping), pressure (market), and
 Outputs to data/forecast.json
 """
 
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 # Weather thresholds
 WEATHER_THRESHOLDS = {
     "sunny": 0.6,      # Score > 0.6
@@ -18,6 +20,10 @@ WEATHER_THRESHOLDS = {
     "stormy": -1.0,    # Everything else
 }
 
+# Weather states from worst to best, split by the thresholds above
+WEATHER_BUCKETS = ("stormy", "rainy", "cloudy", "partly_cloudy", "sunny")
+WEATHER_BINS = np.array([WEATHER_THRESHOLDS[w] for w in WEATHER_BUCKETS[1:]])
+
 # Weather display info
 WEATHER_INFO = {
     "sunny": {"icon": "sunny", "emoji": "sunny", "label": "Sunny", "description": "Bright outlook with strong signals"},
@@ -36,6 +42,13 @@ WEIGHTS = {
     "competitive": 0.25,
 }
 
+# Column order of the per-company score matrix
+SIGNALS = tuple(WEIGHTS)
+SIGNAL_WEIGHTS = np.array([WEIGHTS[s] for s in SIGNALS])
+
+# Shared default for missing per-company sections; only ever read from
+_EMPTY = {}
+
 # Company to stock ticker mapping
 COMPANY_STOCK_MAP = {
     "anthropic": None,  # Private
@@ -48,9 +61,8 @@ COMPANY_STOCK_MAP = {
 def load_json(path):
     """Load a JSON file, return None if not found."""
     try:
-        with open(path) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        return orjson.loads(path.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
         print(f"Warning: Could not load {path}: {e}")
         return None
 
@@ -62,9 +74,10 @@ def normalize_score(value, min_val, max_val):
     return max(0, min(1, (value - min_val) / (max_val - min_val)))
 
 
-def calculate_sentiment_score(mood_data, buzz_data, company_id):
+def calculate_sentiment_score(mood_data, company_buzz):
     """
-    Calculate sentiment score (0-1) from mood and HN buzz data.
+    Calculate sentiment score (0-1) from mood and the company's HN buzz data.
+    company_buzz is None when there is no buzz data at all.
     """
     scores = []
 
@@ -75,8 +88,7 @@ def calculate_sentiment_score(mood_data, buzz_data, company_id):
         scores.append((raw_score + 1) / 2)
 
     # HN sentiment from buzz data
-    if buzz_data and "companies" in buzz_data:
-        company_buzz = buzz_data["companies"].get(company_id, {})
+    if company_buzz is not None:
         hn_sentiment = company_buzz.get("sentiment", 0)
         # HN sentiment is -1 to 1, normalize to 0-1
         scores.append((hn_sentiment + 1) / 2)
@@ -84,17 +96,15 @@ def calculate_sentiment_score(mood_data, buzz_data, company_id):
     return sum(scores) / len(scores) if scores else None
 
 
-def calculate_shipping_score(pulse_data, company_id):
+def calculate_shipping_score(company_pulse):
     """
     Calculate shipping/release velocity score (0-1).
-    Based on recent releases and activity levels.
+    Based on the company's recent activity levels.
     """
-    if not pulse_data or "companies" not in pulse_data:
+    if company_pulse is None:
         return None
 
-    company_pulse = pulse_data["companies"].get(company_id, {})
     activity = company_pulse.get("activity", [])
-    releases = company_pulse.get("releases", [])
 
     if not activity:
         return None
@@ -107,19 +117,23 @@ def calculate_shipping_score(pulse_data, company_id):
     return min(1.0, avg_recent / 3.0)
 
 
-def calculate_market_score(stocks_data, company_id):
+def build_stock_index(stocks_data):
+    """Index stocks data by ticker."""
+    if not stocks_data:
+        return {}
+    return {stock["ticker"]: stock for stock in stocks_data.get("stocks", [])}
+
+
+def calculate_market_score(stock_index, company_id):
     """
     Calculate market momentum score (0-1).
     Based on stock performance over recent period.
     """
-    if not stocks_data or "stocks" not in stocks_data:
-        return None
-
     ticker = COMPANY_STOCK_MAP.get(company_id)
     if not ticker:
         return None  # Private company
 
-    stock = next((s for s in stocks_data["stocks"] if s["ticker"] == ticker), None)
+    stock = stock_index.get(ticker)
     if not stock:
         return None
 
@@ -128,8 +142,9 @@ def calculate_market_score(stocks_data, company_id):
         return None
 
     # Calculate momentum: recent price vs 30-day average
-    recent_price = history[-1] if history else 0
-    avg_30d = sum(history[-30:]) / min(len(history), 30) if history else 0
+    prices = np.asarray(history, dtype=float)
+    recent_price = prices[-1]
+    avg_30d = prices[-30:].mean()
 
     if avg_30d == 0:
         return 0.5
@@ -138,87 +153,90 @@ def calculate_market_score(stocks_data, company_id):
     momentum = recent_price / avg_30d
 
     # Normalize: 0.8 (-20%) = 0, 1.0 (0%) = 0.5, 1.2 (+20%) = 1.0
-    return max(0, min(1, (momentum - 0.8) / 0.4))
+    return float(np.clip((momentum - 0.8) / 0.4, 0, 1))
 
 
-def calculate_competitive_score(buzz_data, pulse_data, company_id, all_companies):
+def calculate_peer_aggregates(buzz_companies, pulse_companies, all_companies):
     """
-    Calculate competitive position score (0-1).
-    Based on relative HN buzz and shipping velocity vs peers.
+    Collect each company's HN points and recent activity for the competitive
+    score. Returns (points, activity) dicts keyed by company.
     """
-    if not buzz_data or not pulse_data:
-        return None
+    points = {c: buzz_companies.get(c, _EMPTY).get("total_points", 0) for c in all_companies}
+    activity = {c: sum(pulse_companies.get(c, _EMPTY).get("activity", [])[:7]) for c in all_companies}
+    return points, activity
+
 
+def calculate_competitive_score(company_points, max_points, company_activity, max_activity):
+    """
+    Calculate competitive position score (0-1).
+    Based on HN buzz and shipping velocity relative to the top peer.
+    """
     scores = []
 
     # HN buzz relative to peers
-    company_buzz = buzz_data.get("companies", {}).get(company_id, {})
-    company_points = company_buzz.get("total_points", 0)
-
-    all_points = [
-        buzz_data.get("companies", {}).get(c, {}).get("total_points", 0)
-        for c in all_companies
-    ]
-    max_points = max(all_points) if all_points else 1
     if max_points > 0:
         scores.append(company_points / max_points)
 
     # Shipping velocity relative to peers
-    company_pulse = pulse_data.get("companies", {}).get(company_id, {})
-    company_activity = sum(company_pulse.get("activity", [])[:7])
-
-    all_activity = [
-        sum(pulse_data.get("companies", {}).get(c, {}).get("activity", [])[:7])
-        for c in all_companies
-    ]
-    max_activity = max(all_activity) if all_activity else 1
     if max_activity > 0:
         scores.append(company_activity / max_activity)
 
     return sum(scores) / len(scores) if scores else None
 
 
-def calculate_vs_peers(value, all_values):
-    """Calculate difference vs peer average."""
-    if value is None or not all_values:
-        return None
-    valid_values = [v for v in all_values if v is not None]
-    if not valid_values:
+def calculate_vs_peers(scores):
+    """
+    Calculate each score's difference vs the peer average of its signal.
+    Takes a (companies, signals) matrix with NaN for missing scores.
+    """
+    present = ~np.isnan(scores)
+    counts = present.sum(axis=0)
+    peer_avg = np.where(present, scores, 0).sum(axis=0) / np.maximum(counts, 1)
+    return scores - peer_avg
+
+
+def format_vs_peers(diff):
+    """Format a vs-peers difference for display, None if missing."""
+    if np.isnan(diff):
         return None
-    avg = sum(valid_values) / len(valid_values)
-    diff = value - avg
     return f"+{diff:.2f}" if diff >= 0 else f"{diff:.2f}"
 
 
-def determine_weather(score):
-    """Determine weather state from composite score."""
-    if score is None:
-        return "foggy"
-    # Convert 0-1 score to -1 to 1 range for thresholds
-    adjusted_score = (score * 2) - 1
-
-    if adjusted_score > WEATHER_THRESHOLDS["sunny"]:
-        return "sunny"
-    elif adjusted_score > WEATHER_THRESHOLDS["partly_cloudy"]:
-        return "partly_cloudy"
-    elif adjusted_score > WEATHER_THRESHOLDS["cloudy"]:
-        return "cloudy"
-    elif adjusted_score > WEATHER_THRESHOLDS["rainy"]:
-        return "rainy"
-    else:
-        return "stormy"
+def calculate_composite_scores(scores):
+    """
+    Calculate weighted composite scores from a (companies, signals) matrix.
+    Missing signals are left out of the weighting; NaN if none are present.
+    """
+    present = ~np.isnan(scores)
+    total_weight = present @ SIGNAL_WEIGHTS
+    weighted_sum = np.where(present, scores, 0) @ SIGNAL_WEIGHTS
+    return np.where(total_weight > 0, weighted_sum / np.where(total_weight > 0, total_weight, 1), np.nan)
+
+
+def determine_weather(scores):
+    """Determine weather states from composite scores, foggy where NaN."""
+    # Convert 0-1 scores to -1 to 1 range for thresholds
+    buckets = np.digitize(scores * 2 - 1, WEATHER_BINS, right=True)
+    return [
+        "foggy" if np.isnan(score) else WEATHER_BUCKETS[bucket]
+        for score, bucket in zip(scores, buckets)
+    ]
 
 
-def generate_summary(signals, weather, company_id):
-    """Generate a human-readable summary of the company's weather."""
+def generate_summary(peer_diffs, weather, company_id):
+    """
+    Generate a human-readable summary of the company's weather.
+    peer_diffs maps each signal to its vs-peers difference (NaN if missing).
+    """
     strengths = []
     weaknesses = []
 
-    for signal_name, signal_data in signals.items():
-        vs_peers = signal_data.get("vs_peers", "")
-        if vs_peers and vs_peers.startswith("+") and float(vs_peers[1:]) > 0.1:
+    for signal_name, diff in peer_diffs.items():
+        # Compare at the displayed precision
+        diff = round(diff, 2)
+        if diff > 0.1:
             strengths.append(signal_name)
-        elif vs_peers and vs_peers.startswith("-") and float(vs_peers[1:]) < -0.1:
+        elif diff < -0.1:
             weaknesses.append(signal_name)
 
     if strengths and not weaknesses:
@@ -231,95 +249,123 @@ def generate_summary(signals, weather, company_id):
         return WEATHER_INFO.get(weather, {}).get("description", "Performance tracking")
 
 
-def main():
-    """Calculate weather for all companies and save forecast."""
+def main(mood_data=None, pulse_data=None, stocks_data=None, buzz_data=None):
+    """
+    Calculate weather for all companies and save forecast.
+    Data already in memory (e.g. the return value of fetch-changelogs.py's
+    main()) can be passed in; anything not given is loaded from disk.
+    """
     script_dir = Path(__file__).parent.parent
     data_dir = script_dir / "public" / "data"
 
     # Load all data sources
-    mood_data = {}
-    for company in ["anthropic", "openai", "google", "meta"]:
-        mood_data[company] = load_json(data_dir / "mood" / f"{company}.json")
-
-    pulse_data = load_json(data_dir / "pulse" / "releases.json")
-    stocks_data = load_json(data_dir / "pressure" / "stocks.json")
-    buzz_data = load_json(data_dir / "buzz" / "hackernews.json")
+    if mood_data is None:
+        mood_data = {}
+        for company in ["anthropic", "openai", "google", "meta"]:
+            mood_data[company] = load_json(data_dir / "mood" / f"{company}.json")
+
+    if pulse_data is None:
+        pulse_data = load_json(data_dir / "pulse" / "releases.json")
+    if stocks_data is None:
+        stocks_data = load_json(data_dir / "pressure" / "stocks.json")
+    if buzz_data is None:
+        buzz_data = load_json(data_dir / "buzz" / "hackernews.json")
 
     all_companies = ["anthropic", "openai", "google", "meta"]
 
     print("Calculating weather forecasts...")
 
+    stock_index = build_stock_index(stocks_data)
+
+    # Per-company sections of the buzz and pulse data, None if unavailable
+    buzz_companies = buzz_data.get("companies") if buzz_data else None
+    pulse_companies = pulse_data.get("companies") if pulse_data else None
+
+    # Peer aggregates for the competitive score, computed once for all companies
+    has_competitive_data = bool(buzz_data and pulse_data)
+    if has_competitive_data:
+        peer_points, peer_activity = calculate_peer_aggregates(
+            buzz_companies or _EMPTY, pulse_companies or _EMPTY, all_companies
+        )
+        max_points = max(peer_points.values())
+        max_activity = max(peer_activity.values())
+
     # First pass: calculate all individual scores
     all_scores = {company: {} for company in all_companies}
 
     for company in all_companies:
-        all_scores[company]["sentiment"] = calculate_sentiment_score(
-            mood_data.get(company), buzz_data, company
-        )
-        all_scores[company]["shipping"] = calculate_shipping_score(pulse_data, company)
-        all_scores[company]["market"] = calculate_market_score(stocks_data, company)
+        company_buzz = buzz_companies.get(company, _EMPTY) if buzz_companies is not None else None
+        company_pulse = pulse_companies.get(company, _EMPTY) if pulse_companies is not None else None
+
+        all_scores[company]["sentiment"] = calculate_sentiment_score(mood_data.get(company), company_buzz)
+        all_scores[company]["shipping"] = calculate_shipping_score(company_pulse)
+        all_scores[company]["market"] = calculate_market_score(stock_index, company)
         all_scores[company]["competitive"] = calculate_competitive_score(
-            buzz_data, pulse_data, company, all_companies
-        )
+            peer_points[company], max_points, peer_activity[company], max_activity
+        ) if has_competitive_data else None
+
+    # Second pass: calculate vs_peers and final weather across all companies
+    # at once; missing scores become NaN
+    scores = np.array(
+        [[all_scores[c][s] for s in SIGNALS] for c in all_companies], dtype=float
+    )
+    vs_peers = calculate_vs_peers(scores)
+    composite_scores = calculate_composite_scores(scores)
+    weathers = determine_weather(composite_scores)
 
-    # Second pass: calculate vs_peers and final weather
     forecast = {}
 
-    for company in all_companies:
+    for i, company in enumerate(all_companies):
         signals = {}
 
-        for signal_name in ["sentiment", "shipping", "market", "competitive"]:
+        for j, signal_name in enumerate(SIGNALS):
             value = all_scores[company][signal_name]
-            all_values = [all_scores[c][signal_name] for c in all_companies]
-            vs_peers = calculate_vs_peers(value, all_values)
-
             signals[signal_name] = {
                 "value": round(value, 2) if value is not None else None,
-                "vs_peers": vs_peers,
+                "vs_peers": format_vs_peers(vs_peers[i, j]),
             }
 
-        # Calculate composite score
-        weighted_sum = 0
-        total_weight = 0
-        for signal_name, weight in WEIGHTS.items():
-            value = all_scores[company][signal_name]
-            if value is not None:
-                weighted_sum += value * weight
-                total_weight += weight
-
-        composite_score = weighted_sum / total_weight if total_weight > 0 else None
-        weather = determine_weather(composite_score)
+        composite_score = None if np.isnan(composite_scores[i]) else float(composite_scores[i])
+        weather = weathers[i]
 
         forecast[company] = {
             "weather": weather,
             "weather_info": WEATHER_INFO.get(weather, WEATHER_INFO["foggy"]),
             "score": round(composite_score, 2) if composite_score is not None else None,
             "signals": signals,
-            "summary": generate_summary(signals, weather, company),
+            "summary": generate_summary(dict(zip(SIGNALS, vs_peers[i])), weather, company),
         }
 
         score_str = f"{composite_score:.2f}" if composite_score is not None else "N/A"
         print(f"  {company}: {weather} (score: {score_str})")
 
     result = {
-        "lastUpdated": datetime.utcnow().isoformat() + "Z",
+        "lastUpdated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "forecast": forecast,
     }
 
-    # Save to both locations
+    # Save to both locations, serializing once
     output_paths = [
         data_dir / "forecast.json",
         script_dir / "data" / "forecast.json",
     ]
+    payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
 
+    written = []
     for output_path in output_paths:
+        # Skip a location that is the same file as one already written,
+        # e.g. when one data directory is a symlink to the other
+        if output_path.exists() and any(output_path.samefile(p) for p in written):
+            continue
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2)
+        output_path.write_bytes(payload)
+        written.append(output_path)
         print(f"Saved forecast to {output_path}")
 
     print("Weather calculation complete!")
 
+    return result
+
 
 if __name__ == "__main__":
     main()
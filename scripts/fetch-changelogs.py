@@ -4,13 +4,18 @@ Fetch changelog/release data for AI companies from their developer docs.
 Outputs to data/pulse/releases.json
 """
 
-import json
+import atexit
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
 # Changelog sources
 SOURCES = {
@@ -44,84 +49,175 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; AI-Weather-Report/1.0)"
 }
 
+# Companies are fetched concurrently; the work is network-bound
+MAX_WORKERS = 8
+
+# Shared session so worker threads reuse TCP/TLS connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# GitHub API headers; a token, when available, lifts the unauthenticated rate limit
+GITHUB_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+if os.environ.get("GITHUB_TOKEN"):
+    GITHUB_HEADERS["Authorization"] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+
+# Releases requested per GitHub repo; only the most recent are used
+GITHUB_PAGE_SIZE = 30
+
+# Conditional-GET cache, as described in backfill-history.py
+HTTP_CACHE_PATH = Path(__file__).parent.parent / "data" / "pulse" / ".http_cache.json"
+
+def load_http_cache():
+    """Load cached HTTP validators and parsed results, or an empty cache if none exists."""
+    try:
+        return orjson.loads(HTTP_CACHE_PATH.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+_http_cache = load_http_cache()
+_http_cache_dirty = False
+
+def save_http_cache():
+    """Write the HTTP cache back to disk if any entry changed."""
+    if not _http_cache_dirty:
+        return
+    HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    HTTP_CACHE_PATH.write_bytes(orjson.dumps(_http_cache))
+
+atexit.register(save_http_cache)
+
+def compile_keywords(keywords):
+    """Compile a keyword list into one regex matching any of them as a substring."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+# Release categories in priority order; anything unmatched is a "feature"
+RELEASE_CATEGORY_PATTERNS = [
+    ("major", compile_keywords(["major", "launch", "release", "new model", "introducing"])),
+    ("deprecation", compile_keywords(["deprecat", "sunset", "removing", "end of"])),
+    ("fix", compile_keywords(["fix", "bug", "patch", "issue", "resolve"])),
+]
+
+# Changelog entry containers and dates within scraped pages
+ENTRY_SELECTOR = ", ".join(
+    f"{tag}[class*={keyword}]"
+    for tag in ("article", "section", "div")
+    for keyword in ("release", "changelog", "update")
+)
+DATE_CLASS_RE = re.compile(r"date")
+HEADING_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2}|\w+ \d{1,2}, \d{4})\b")
+HEADING_DATE_STRIP_RE = re.compile(r"\s*-?\s*\d{4}-\d{2}-\d{2}|\w+ \d{1,2}, \d{4}")
+
+# Top-level elements the Anthropic scraper reads; the rest of the page (nav,
+# scripts, footer) is never built into the tree. Matched elements keep their
+# children.
+ANTHROPIC_STRAINER = SoupStrainer(["article", "section", "div", "h2", "h3", "h4", "time"])
+
 def categorize_release(title):
     """Categorize a release based on its title."""
     title_lower = title.lower()
-
-    if any(kw in title_lower for kw in ["major", "launch", "release", "new model", "introducing"]):
-        return "major"
-    elif any(kw in title_lower for kw in ["deprecat", "sunset", "removing", "end of"]):
-        return "deprecation"
-    elif any(kw in title_lower for kw in ["fix", "bug", "patch", "issue", "resolve"]):
-        return "fix"
-    else:
-        return "feature"
+    for category, pattern in RELEASE_CATEGORY_PATTERNS:
+        if pattern.search(title_lower):
+            return category
+    return "feature"
+
+# Supported date shapes; numeric ones are built directly, the rest make
+# exactly one strptime call
+ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})(?:T\d{1,2}:\d{1,2}:\d{1,2}Z)?$")
+US_DATE_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+MONTH_FIRST_DATE_RE = re.compile(r"^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$")
+DAY_FIRST_DATE_RE = re.compile(r"^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$")
 
 def parse_date(date_str):
-    """Try to parse a date string in various formats."""
-    formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%d %B %Y",
-        "%d %b %Y",
-        "%m/%d/%Y",
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
+    """Parse an ISO, "MM/DD/YYYY", "Month DD, YYYY" or "DD Month YYYY" date
+    string, returning a date or None."""
+    date_str = date_str.strip()
 
-    return ""
+    try:
+        match = ISO_DATE_RE.match(date_str)
+        if match:
+            year, month, day = match.groups()
+            return date(int(year), int(month), int(day))
+
+        match = US_DATE_RE.match(date_str)
+        if match:
+            month, day, year = match.groups()
+            return date(int(year), int(month), int(day))
+
+        match = MONTH_FIRST_DATE_RE.match(date_str)
+        if match:
+            month, day, year = match.groups()
+            month_fmt = "%b" if len(month) == 3 else "%B"
+            return datetime.strptime(f"{month} {day} {year}", f"{month_fmt} %d %Y").date()
+
+        match = DAY_FIRST_DATE_RE.match(date_str)
+        if match:
+            day, month, year = match.groups()
+            month_fmt = "%b" if len(month) == 3 else "%B"
+            return datetime.strptime(f"{day} {month} {year}", f"%d {month_fmt} %Y").date()
+    except ValueError:
+        pass
+
+    return None
+
+def format_date(date):
+    """Format a parsed date as YYYY-MM-DD, or "" if it couldn't be parsed."""
+    return date.strftime("%Y-%m-%d") if date else ""
+
+def strip_private_fields(release):
+    """Drop in-process fields such as _date_obj from a release."""
+    return {k: v for k, v in release.items() if not k.startswith("_")}
 
 def scrape_anthropic_changelog():
     """Scrape Anthropic's release notes."""
     releases = []
 
     try:
-        response = requests.get(SOURCES["anthropic"]["url"], headers=HEADERS, timeout=30)
+        response = SESSION.get(SOURCES["anthropic"]["url"], timeout=30)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.content, "lxml", parse_only=ANTHROPIC_STRAINER)
 
         # Look for release entries
-        entries = soup.find_all(["article", "section", "div"], class_=re.compile(r"release|changelog|update"))
+        entries = soup.select(ENTRY_SELECTOR)
 
         if not entries:
             # Try finding headings with dates
-            headings = soup.find_all(["h2", "h3", "h4"])
+            headings = soup.select("h2, h3, h4")
             for heading in headings:
                 text = heading.get_text(strip=True)
                 # Check if heading contains a date-like pattern
-                date_match = re.search(r"\b(\d{4}-\d{2}-\d{2}|\w+ \d{1,2}, \d{4})\b", text)
+                date_match = HEADING_DATE_RE.search(text)
                 if date_match:
-                    date_str = parse_date(date_match.group(1))
-                    title = re.sub(r"\s*-?\s*\d{4}-\d{2}-\d{2}|\w+ \d{1,2}, \d{4}", "", text).strip()
+                    date = parse_date(date_match.group(1))
+                    title = HEADING_DATE_STRIP_RE.sub("", text).strip()
                     if title:
                         releases.append({
-                            "date": date_str,
+                            "date": format_date(date),
                             "type": categorize_release(title),
                             "title": title[:100],
+                            "_date_obj": date,
                         })
         else:
             for entry in entries[:30]:
-                date_elem = entry.find("time") or entry.find(class_=re.compile(r"date"))
+                date_elem = entry.find("time") or entry.find(class_=DATE_CLASS_RE)
                 title_elem = entry.find(["h2", "h3", "h4", "a"])
 
-                date_str = ""
+                date = None
                 if date_elem:
-                    date_str = parse_date(date_elem.get("datetime", "") or date_elem.get_text(strip=True))
+                    date = parse_date(date_elem.get("datetime", "") or date_elem.get_text(strip=True))
 
                 title = title_elem.get_text(strip=True) if title_elem else ""
 
                 if title:
                     releases.append({
-                        "date": date_str,
+                        "date": format_date(date),
                         "type": categorize_release(title),
                         "title": title[:100],
+                        "_date_obj": date,
                     })
 
         print(f"Scraped {len(releases)} releases from Anthropic changelog")
@@ -131,39 +227,74 @@ def scrape_anthropic_changelog():
 
     # If scraping failed, try GitHub SDK releases as fallback
     if not releases and "github_url" in SOURCES["anthropic"]:
-        releases = fetch_github_releases(SOURCES["anthropic"]["github_url"], "Anthropic Python SDK")
-        if "github_alt" in SOURCES["anthropic"]:
-            alt_releases = fetch_github_releases(SOURCES["anthropic"]["github_alt"], "Anthropic TypeScript SDK")
-            existing_dates = {r["date"] for r in releases}
+        # Fetch both SDKs' releases in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            primary = executor.submit(fetch_github_releases, SOURCES["anthropic"]["github_url"], "Anthropic Python SDK")
+            alt = None
+            if "github_alt" in SOURCES["anthropic"]:
+                alt = executor.submit(fetch_github_releases, SOURCES["anthropic"]["github_alt"], "Anthropic TypeScript SDK")
+        releases = primary.result()
+        if alt:
+            alt_releases = alt.result()
+            seen = {(r["date"], r["title"]) for r in releases}
             for r in alt_releases:
-                if r["date"] not in existing_dates:
+                key = (r["date"], r["title"])
+                if key not in seen:
                     releases.append(r)
-                    existing_dates.add(r["date"])
-            releases.sort(key=lambda x: x.get("date", ""), reverse=True)
+                    seen.add(key)
+            releases.sort(key=itemgetter("date"), reverse=True)
 
     return releases
 
 def fetch_github_releases(url, name):
-    """Fetch releases from GitHub API."""
+    """Fetch releases from GitHub API, reusing the cached releases on a 304."""
+    global _http_cache_dirty
     releases = []
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        cached = _http_cache.get(url)
+
+        headers = dict(GITHUB_HEADERS)
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = SESSION.get(url, params={"per_page": GITHUB_PAGE_SIZE}, headers=headers, timeout=30)
+
+        if response.status_code == 304 and cached:
+            releases = [
+                {**r, "_date_obj": datetime.fromisoformat(r["date"]).date() if r["date"] else None}
+                for r in cached["releases"]
+            ]
+            print(f"{name} releases unchanged, reusing {len(releases)} cached")
+            return releases
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
-        for release in data[:30]:
-            date_str = parse_date(release.get("published_at", ""))
+        for release in data[:GITHUB_PAGE_SIZE]:
+            date = parse_date(release.get("published_at", ""))
             title = release.get("name", "") or release.get("tag_name", "")
 
             if title:
                 releases.append({
-                    "date": date_str,
+                    "date": format_date(date),
                     "type": categorize_release(title),
                     "title": title[:100],
+                    "_date_obj": date,
                 })
 
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _http_cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "releases": [strip_private_fields(r) for r in releases],
+            }
+            _http_cache_dirty = True
+
         print(f"Fetched {len(releases)} releases from {name}")
 
     except Exception as e:
@@ -175,21 +306,27 @@ def scrape_openai_changelog():
     """Fetch OpenAI releases from GitHub API (SDK releases as proxy for API changes)."""
     releases = []
 
-    # Try OpenAI Python SDK first
-    releases = fetch_github_releases(SOURCES["openai"]["url"], "OpenAI Python SDK")
-
-    # Also try Node SDK and merge
-    if "alt_url" in SOURCES["openai"]:
-        alt_releases = fetch_github_releases(SOURCES["openai"]["alt_url"], "OpenAI Node SDK")
-        # Merge and deduplicate by date
-        existing_dates = {r["date"] for r in releases}
+    # Fetch the Python SDK and Node SDK releases in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        primary = executor.submit(fetch_github_releases, SOURCES["openai"]["url"], "OpenAI Python SDK")
+        alt = None
+        if "alt_url" in SOURCES["openai"]:
+            alt = executor.submit(fetch_github_releases, SOURCES["openai"]["alt_url"], "OpenAI Node SDK")
+
+    # Python SDK first, then merge in the Node SDK
+    releases = primary.result()
+    if alt:
+        alt_releases = alt.result()
+        # Merge, skipping releases already present with the same date and title
+        seen = {(r["date"], r["title"]) for r in releases}
         for r in alt_releases:
-            if r["date"] not in existing_dates:
+            key = (r["date"], r["title"])
+            if key not in seen:
                 releases.append(r)
-                existing_dates.add(r["date"])
+                seen.add(key)
 
     # Sort by date descending
-    releases.sort(key=lambda x: x.get("date", ""), reverse=True)
+    releases.sort(key=itemgetter("date"), reverse=True)
 
     return releases
 
@@ -198,24 +335,26 @@ def scrape_google_changelog():
     releases = []
 
     try:
-        response = requests.get(SOURCES["google"]["url"], headers=HEADERS, timeout=30)
+        response = SESSION.get(SOURCES["google"]["url"], timeout=30)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Not strained: a heading's entry can be any element that follows it
+        soup = BeautifulSoup(response.content, "lxml")
 
         # Google typically uses headings with dates
-        headings = soup.find_all(["h2", "h3"])
+        headings = soup.select("h2, h3")
 
         for heading in headings:
             text = heading.get_text(strip=True)
-            date_match = re.search(r"\b(\d{4}-\d{2}-\d{2}|\w+ \d{1,2}, \d{4})\b", text)
+            date_match = HEADING_DATE_RE.search(text)
             if date_match:
-                date_str = parse_date(date_match.group(1))
+                date = parse_date(date_match.group(1))
 
-                # Get the next sibling elements for content
+                # Get the next sibling element for content; another heading
+                # means this one has no body, so don't take the next section's
                 next_elem = heading.find_next_sibling()
                 title = ""
-                if next_elem:
+                if next_elem and next_elem.name not in ("h2", "h3"):
                     # Get first list item or paragraph as title
                     li = next_elem.find("li")
                     if li:
@@ -227,9 +366,10 @@ def scrape_google_changelog():
                     title = text
 
                 releases.append({
-                    "date": date_str,
+                    "date": format_date(date),
                     "type": categorize_release(title),
                     "title": title,
+                    "_date_obj": date,
                 })
 
         print(f"Scraped {len(releases)} releases from Google")
@@ -266,83 +406,65 @@ def fetch_meta_github_releases():
 
     return releases
 
-def calculate_activity(releases):
-    """Calculate weekly activity counts from releases."""
-    activity = []
-    now = datetime.utcnow()
+def calculate_activity(releases, today, weeks=14):
+    """Calculate weekly activity counts from releases up to today, oldest week first."""
+    activity = [0] * weeks
 
-    # Count releases per week for last 14 weeks
-    for week in range(14):
-        week_start = now - timedelta(days=(week + 1) * 7)
-        week_end = now - timedelta(days=week * 7)
-
-        count = 0
-        for release in releases:
-            if release["date"]:
-                try:
-                    release_date = datetime.strptime(release["date"], "%Y-%m-%d")
-                    if week_start <= release_date < week_end:
-                        count += 1
-                except ValueError:
-                    pass
+    # Bucket each release by how many whole weeks ago it was, using the
+    # date parsed at scrape time
+    for release in releases:
+        release_date = release.get("_date_obj")
+        if not release_date:
+            continue
 
-        activity.insert(0, count)
+        days_ago = (today - release_date).days
+        if 0 <= days_ago < weeks * 7:
+            activity[weeks - 1 - days_ago // 7] += 1
 
     return activity
 
-from datetime import timedelta
-
 def main():
-    """Main function to fetch all changelogs and save pulse data."""
+    """Fetch all changelogs, save pulse data and return it."""
     script_dir = Path(__file__).parent.parent
     output_path = script_dir / "data" / "pulse" / "releases.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     print("Fetching changelog data...")
 
-    companies = {}
+    now = datetime.now(timezone.utc)
+    today = now.date()
 
-    # Anthropic
-    anthropic_releases = scrape_anthropic_changelog()
-    companies["anthropic"] = {
-        "name": "Anthropic",
-        "releases": anthropic_releases[:10],
-        "activity": calculate_activity(anthropic_releases),
+    fetchers = {
+        "anthropic": scrape_anthropic_changelog,
+        "openai": scrape_openai_changelog,
+        "google": scrape_google_changelog,
+        "meta": fetch_meta_github_releases,
     }
 
-    # OpenAI
-    openai_releases = scrape_openai_changelog()
-    companies["openai"] = {
-        "name": "OpenAI",
-        "releases": openai_releases[:10],
-        "activity": calculate_activity(openai_releases),
-    }
+    # Fetch all companies in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {company_id: executor.submit(fetch) for company_id, fetch in fetchers.items()}
 
-    # Google
-    google_releases = scrape_google_changelog()
-    companies["google"] = {
-        "name": "Google DeepMind",
-        "releases": google_releases[:10],
-        "activity": calculate_activity(google_releases),
-    }
+    companies = {}
 
-    # Meta
-    meta_releases = fetch_meta_github_releases()
-    companies["meta"] = {
-        "name": "Meta AI",
-        "releases": meta_releases[:10],
-        "activity": calculate_activity(meta_releases),
-    }
+    for company_id, future in futures.items():
+        releases = future.result()
+        companies[company_id] = {
+            "name": SOURCES[company_id]["name"],
+            "releases": [strip_private_fields(r) for r in releases[:10]],
+            "activity": calculate_activity(releases, today),
+        }
 
     data = {
-        "lastUpdated": datetime.utcnow().isoformat() + "Z",
+        "lastUpdated": now.isoformat().replace("+00:00", "Z"),
         "companies": companies,
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     print(f"Saved pulse data to {output_path}")
 
+    return data
+
 if __name__ == "__main__":
     main()
@@ -5,14 +5,18 @@ Uses RSS where available, web scraping where not.
 Outputs to data/mood/{company}.json
 """
 
-import json
+import atexit
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import feedparser
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
 # RSS feeds and scraping targets
 SOURCES = {
@@ -39,21 +43,98 @@ SOURCES = {
     },
 }
 
+def compile_keywords(keywords):
+    """Compile a keyword list into one regex matching any of them as a substring."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+# All keywords in one pattern so each post is scanned once per field
+for feed_source in SOURCES.values():
+    if "filter_keywords" in feed_source:
+        feed_source["filter_re"] = compile_keywords(feed_source["filter_keywords"])
+
+# Sources are fetched concurrently; the work is network-bound
+MAX_WORKERS = 8
+
+# Shared session so worker threads reuse TCP/TLS connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# Conditional-GET cache, as described in backfill-history.py
+HTTP_CACHE_PATH = Path(__file__).parent.parent / "data" / "mood" / ".http_cache.json"
+
+def load_http_cache():
+    """Load cached HTTP validators and parsed results, or an empty cache if none exists."""
+    try:
+        return orjson.loads(HTTP_CACHE_PATH.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+_http_cache = load_http_cache()
+_http_cache_dirty = False
+
+def save_http_cache():
+    """Write the HTTP cache back to disk if any entry changed."""
+    if not _http_cache_dirty:
+        return
+    HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    HTTP_CACHE_PATH.write_bytes(orjson.dumps(_http_cache))
+
+atexit.register(save_http_cache)
+
+def store_http_cache(url, etag, last_modified, posts):
+    """Remember a page's validators and the posts parsed from it."""
+    global _http_cache_dirty
+    if etag or last_modified:
+        _http_cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "posts": posts,
+        }
+        _http_cache_dirty = True
+
+def fetch_cached(url, parse, headers, timeout=30):
+    """Fetch url and return parse(response), reusing the cached posts on a 304."""
+    cached = _http_cache.get(url)
+
+    headers = dict(headers)
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = SESSION.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return list(cached["posts"])
+    response.raise_for_status()
+
+    posts = parse(response)
+    store_http_cache(url, response.headers.get("ETag"), response.headers.get("Last-Modified"), posts)
+    return posts
+
 def fetch_rss_feed(source):
-    """Fetch posts from an RSS feed."""
+    """Fetch posts from an RSS feed, reusing last run's posts if it's unchanged."""
     posts = []
 
     try:
-        feed = feedparser.parse(source["url"])
+        cached = _http_cache.get(source["url"])
+        feed = feedparser.parse(
+            source["url"],
+            etag=cached.get("etag") if cached else None,
+            modified=cached.get("last_modified") if cached else None,
+        )
+        if feed.get("status") == 304 and cached:
+            posts = list(cached["posts"])
+            print(f"{source['name']} RSS unchanged, reusing {len(posts)} cached posts")
+            return posts
 
         for entry in feed.entries[:20]:  # Get up to 20 entries
             title = entry.get("title", "")
 
             # Apply keyword filter if specified
-            if "filter_keywords" in source:
-                title_lower = title.lower()
-                summary_lower = entry.get("summary", "").lower()
-                if not any(kw in title_lower or kw in summary_lower for kw in source["filter_keywords"]):
+            keyword_re = source.get("filter_re")
+            if keyword_re:
+                if not (keyword_re.search(title.lower())
+                        or keyword_re.search(entry.get("summary", "").lower())):
                     continue
 
             # Parse date
@@ -70,6 +151,8 @@ def fetch_rss_feed(source):
                 "summary": entry.get("summary", "")[:500],  # Truncate summary
             })
 
+        store_http_cache(source["url"], feed.get("etag"), feed.get("modified"), posts)
+
         print(f"Fetched {len(posts)} posts from {source['name']} RSS")
 
     except Exception as e:
@@ -77,6 +160,26 @@ def fetch_rss_feed(source):
 
     return posts
 
+def parse_anthropic_news(response):
+    """Parse posts from the Anthropic news page."""
+    seen_urls = set()
+
+    soup = BeautifulSoup(response.content, "lxml")
+
+    # Primary: DOM-based scraping (most reliable for complete data)
+    posts = scrape_anthropic_dom_fallback(soup, seen_urls)
+
+    # Fallback: Try JSON extraction if DOM scraping fails
+    if not posts:
+        posts_found = extract_posts_from_nextjs_data(response.text)
+        if posts_found:
+            for post in posts_found:
+                if post["url"] not in seen_urls:
+                    seen_urls.add(post["url"])
+                    posts.append(post)
+
+    return posts
+
 def scrape_anthropic_news():
     """Scrape news from Anthropic's website with proper date extraction.
 
@@ -84,7 +187,6 @@ def scrape_anthropic_news():
     which has the complete article information.
     """
     posts = []
-    seen_urls = set()
     url = "https://www.anthropic.com/news"
 
     headers = {
@@ -92,36 +194,70 @@ def scrape_anthropic_news():
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        html = response.text
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Primary: DOM-based scraping (most reliable for complete data)
-        posts = scrape_anthropic_dom_fallback(soup, seen_urls)
-
-        # Fallback: Try JSON extraction if DOM scraping fails
-        if not posts:
-            posts_found = extract_posts_from_nextjs_data(html)
-            if posts_found:
-                for post in posts_found:
-                    if post["url"] not in seen_urls:
-                        seen_urls.add(post["url"])
-                        posts.append(post)
+        posts = fetch_cached(url, parse_anthropic_news, headers)
 
     except Exception as e:
         print(f"Error scraping Anthropic news page: {e}")
 
-    # Also scrape special landing pages (not under /news/)
-    special_pages = scrape_anthropic_special_pages(headers, seen_urls)
+    # Also scrape special landing pages (not under /news/), keeping only
+    # those the news page didn't already list
+    news_urls = {post["url"] for post in posts}
+    special_pages = [
+        post for post in scrape_anthropic_special_pages(headers)
+        if post["url"] not in news_urls
+    ]
     posts = special_pages + posts  # Put special pages first (usually more recent)
 
     print(f"Scraped {len(posts)} posts from Anthropic")
     return posts
 
 
-def scrape_anthropic_special_pages(headers, seen_urls):
+def parse_anthropic_special_page(response, page_info):
+    """Parse a special landing page into a single-post list, or [] if it has no title."""
+    soup = BeautifulSoup(response.content, "lxml")
+
+    # Try to extract title - prefer og:title, then h1, then title tag
+    title = None
+    og_title = soup.find("meta", {"property": "og:title"})
+    if og_title:
+        title = og_title.get("content", "").strip()
+
+    if not title:
+        h1 = soup.find("h1")
+        if h1:
+            title = h1.get_text(strip=True)
+
+    if not title:
+        title_tag = soup.find("title")
+        if title_tag:
+            title = title_tag.get_text(strip=True)
+            title = title.replace(" | Anthropic", "").replace(" - Anthropic", "").strip()
+
+    # Use fallback title if extraction failed
+    if not title or len(title) < 5:
+        title = page_info.get("fallback_title", "")
+
+    if not title:
+        return []
+
+    # Try to find date - use fallback if not found
+    date_str = page_info.get("fallback_date", "")
+
+    # Try to get summary/description
+    summary = ""
+    meta_desc = soup.find("meta", {"property": "og:description"}) or soup.find("meta", {"name": "description"})
+    if meta_desc:
+        summary = meta_desc.get("content", "")[:500]
+
+    return [{
+        "title": title,
+        "date": date_str,
+        "url": page_info["url"],
+        "summary": summary,
+    }]
+
+
+def scrape_anthropic_special_pages(headers):
     """Scrape special landing pages that aren't under /news/."""
     special_posts = []
 
@@ -138,62 +274,71 @@ def scrape_anthropic_special_pages(headers, seen_urls):
 
     for page_info in special_pages:
         page_url = page_info["url"]
-        if page_url in seen_urls:
-            continue
-
         try:
-            response = requests.get(page_url, headers=headers, timeout=15)
-            if response.status_code != 200:
-                continue
-
-            soup = BeautifulSoup(response.text, "html.parser")
+            page_posts = fetch_cached(
+                page_url,
+                lambda response: parse_anthropic_special_page(response, page_info),
+                headers,
+                timeout=15,
+            )
+            special_posts.extend(page_posts)
+
+        except requests.HTTPError:
+            # Page missing or unavailable; nothing to add
+            continue
+        except Exception as e:
+            print(f"Error scraping special page {page_url}: {e}")
 
-            # Try to extract title - prefer og:title, then h1, then title tag
-            title = None
-            og_title = soup.find("meta", {"property": "og:title"})
-            if og_title:
-                title = og_title.get("content", "").strip()
+    return special_posts
 
-            if not title:
-                h1 = soup.find("h1")
-                if h1:
-                    title = h1.get_text(strip=True)
 
-            if not title:
-                title_tag = soup.find("title")
-                if title_tag:
-                    title = title_tag.get_text(strip=True)
-                    title = title.replace(" | Anthropic", "").replace(" - Anthropic", "").strip()
+# Next.js page data, and the strings and brackets of JSON embedded inline in
+# the page. Strings may hold markup but can't span lines, so a stray quote in
+# page text never pairs with a quote on a later line.
+NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>([^<]+)</script>')
+JSON_TOKEN_RE = re.compile(r'"((?:[^"\\\n]|\\.)*)"(\s*:)?|[{}\[\]]')
 
-            # Use fallback title if extraction failed
-            if not title or len(title) < 5:
-                title = page_info.get("fallback_title", "")
+def find_inline_posts(html):
+    """Find (title, slug, publishedOn) for each object in inline JSON with a slug.
 
-            if not title:
+    Fields are collected per object, in any key order, so a date always
+    belongs to the post it was found in. Posts are returned in page order.
+    """
+    found = []
+    # One frame per open object: [key it was opened under, start, fields]
+    stack = []
+    key = None
+
+    for match in JSON_TOKEN_RE.finditer(html):
+        token = match.group(0)
+        if token == "{":
+            stack.append([key, match.start(), {}])
+            key = None
+        elif token == "}":
+            if not stack:
                 continue
-
-            # Try to find date - use fallback if not found
-            date_str = page_info.get("fallback_date", "")
-
-            # Try to get summary/description
-            summary = ""
-            meta_desc = soup.find("meta", {"property": "og:description"}) or soup.find("meta", {"name": "description"})
-            if meta_desc:
-                summary = meta_desc.get("content", "")[:500]
-
-            seen_urls.add(page_url)
-            special_posts.append({
-                "title": title,
-                "date": date_str,
-                "url": page_url,
-                "summary": summary,
-            })
-
-        except Exception as e:
-            print(f"Error scraping special page {page_url}: {e}")
-
-    return special_posts
-
+            frame_key, start, fields = stack.pop()
+            if frame_key == "slug" and "current" in fields and stack:
+                stack[-1][2].setdefault("slug", fields["current"])
+            elif fields.get("title") and fields.get("slug"):
+                found.append((start, fields["title"], fields["slug"], fields.get("publishedOn")))
+        elif token in ("[", "]"):
+            key = None
+        elif match.group(2):
+            key = match.group(1)
+        else:
+            if key in ("title", "current", "publishedOn") and stack:
+                value = match.group(1)
+                if "\\" in value:
+                    try:
+                        value = orjson.loads(token)
+                    except orjson.JSONDecodeError:
+                        pass
+                stack[-1][2].setdefault(key, value)
+            key = None
+
+    found.sort(key=itemgetter(0))
+    return [post[1:] for post in found]
 
 def extract_posts_from_nextjs_data(html):
     """Extract post data from Next.js embedded JSON."""
@@ -201,31 +346,18 @@ def extract_posts_from_nextjs_data(html):
     seen_slugs = set()
 
     # Try to find the __NEXT_DATA__ script tag first (most reliable)
-    next_data_pattern = r'<script id="__NEXT_DATA__"[^>]*>([^<]+)</script>'
-    match = re.search(next_data_pattern, html)
+    match = NEXT_DATA_RE.search(html)
     if match:
         try:
-            data = json.loads(match.group(1))
+            data = orjson.loads(match.group(1))
             posts = extract_from_next_data_json(data)
             if posts:
                 return posts
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             pass
 
-    # Fallback: Extract individual fields and correlate by position/proximity
-    # Find all title-slug-date triplets in the embedded JSON
-
-    # Look for title followed by slug pattern within reasonable distance
-    # The title field appears before slug in the JSON structure
-    pattern = r'"title"\s*:\s*"([^"]+)"[^}]*?"slug"\s*:\s*\{\s*"current"\s*:\s*"([^"]+)"'
-    title_slug_matches = re.findall(pattern, html, re.DOTALL)
-
-    # Also extract publishedOn dates
-    date_pattern = r'"publishedOn"\s*:\s*"([^"]+)"'
-    dates = re.findall(date_pattern, html)
-
-    # Match titles with slugs and try to find corresponding dates
-    for i, (title, slug) in enumerate(title_slug_matches):
+    # Fallback: Find title-slug-date triplets in the embedded JSON
+    for title, slug, date in find_inline_posts(html):
         if slug in seen_slugs:
             continue
         seen_slugs.add(slug)
@@ -234,11 +366,10 @@ def extract_posts_from_nextjs_data(html):
         if len(title) < 10 or title.lower() in ['news', 'research', 'announcements']:
             continue
 
-        # Try to get date - use index if available
         formatted_date = ""
-        if i < len(dates):
+        if date:
             try:
-                parsed_date = datetime.fromisoformat(dates[i].replace('Z', '+00:00'))
+                parsed_date = datetime.fromisoformat(date.replace('Z', '+00:00'))
                 formatted_date = parsed_date.strftime("%Y-%m-%d")
             except (ValueError, TypeError):
                 pass
@@ -255,12 +386,21 @@ def extract_posts_from_nextjs_data(html):
     return posts
 
 
+# save_mood_data keeps at most this many posts, so stop walking once found
+MAX_NEXT_DATA_POSTS = 20
+
 def extract_from_next_data_json(data):
-    """Extract posts from parsed __NEXT_DATA__ JSON."""
+    """Extract posts from parsed __NEXT_DATA__ JSON.
+
+    Walks the JSON depth-first with an explicit stack, in document order,
+    and stops as soon as enough distinct posts have been found.
+    """
     posts = []
+    seen_urls = set()
 
-    def find_posts(obj, path=""):
-        """Recursively find post objects in the JSON structure."""
+    stack = [data]
+    while stack and len(posts) < MAX_NEXT_DATA_POSTS:
+        obj = stack.pop()
         if isinstance(obj, dict):
             # Check if this looks like a post object
             if "publishedOn" in obj and "title" in obj:
@@ -277,28 +417,30 @@ def extract_from_next_data_json(data):
                     if isinstance(slug, dict):
                         slug = slug.get("current", "")
 
-                    if title and slug:
+                    url = f"https://www.anthropic.com/news/{slug}"
+                    if title and slug and url not in seen_urls:
+                        seen_urls.add(url)
                         posts.append({
                             "title": title,
                             "date": formatted_date,
-                            "url": f"https://www.anthropic.com/news/{slug}",
+                            "url": url,
                             "summary": obj.get("excerpt", "")[:500] if obj.get("excerpt") else "",
                         })
                 except (ValueError, TypeError, AttributeError):
                     pass
 
-            # Continue searching nested objects
-            for key, value in obj.items():
-                find_posts(value, f"{path}.{key}")
+            # Continue searching nested objects, reversed so they pop in order
+            stack.extend(reversed(obj.values()))
 
         elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                find_posts(item, f"{path}[{i}]")
+            stack.extend(reversed(obj))
 
-    find_posts(data)
     return posts
 
 
+# Article links on the Anthropic news page
+NEWS_HREF_RE = re.compile(r"/news/")
+
 def scrape_anthropic_dom_fallback(soup, seen_urls):
     """DOM-based scraping for Anthropic news articles.
 
@@ -312,7 +454,7 @@ def scrape_anthropic_dom_fallback(soup, seen_urls):
                   'Case Study', 'CaseStudy', 'News', 'Company']
 
     # Find all news article links
-    for link in soup.select('a[href*="/news/"]'):
+    for link in soup.find_all("a", href=NEWS_HREF_RE):
         href = link.get('href', '')
 
         # Skip non-article links
@@ -360,6 +502,9 @@ def scrape_anthropic_dom_fallback(soup, seen_urls):
     return posts
 
 
+# "Mon DD, YYYY" dates inside Anthropic article link text
+ARTICLE_DATE_RE = re.compile(r'([A-Z][a-z]{2}\s+\d{1,2},\s+\d{4})')
+
 def parse_anthropic_article_text(text, categories):
     """Parse article text that may contain: Category + Date + Title + Summary.
 
@@ -368,11 +513,8 @@ def parse_anthropic_article_text(text, categories):
     - "Jan 28, 2026AnnouncementsServiceNow chooses Claude..."
     - "ProductOct 15, 2025Introducing Claude Haiku 4.5..."
     """
-    # Date patterns
-    date_pattern = r'([A-Z][a-z]{2}\s+\d{1,2},\s+\d{4})'
-
     # Try to find date in the text
-    date_match = re.search(date_pattern, text)
+    date_match = ARTICLE_DATE_RE.search(text)
     date_str = ""
     if date_match:
         try:
@@ -382,7 +524,7 @@ def parse_anthropic_article_text(text, categories):
             pass
 
     # Remove date from text
-    text_no_date = re.sub(date_pattern, '|||', text)
+    text_no_date = ARTICLE_DATE_RE.sub('|||', text)
 
     # Remove category prefixes
     for cat in categories:
@@ -393,7 +535,7 @@ def parse_anthropic_article_text(text, categories):
 
     if not parts:
         # Fallback: just remove date and take what's left
-        title = re.sub(date_pattern, '', text).strip()
+        title = ARTICLE_DATE_RE.sub('', text).strip()
         for cat in categories:
             title = title.replace(cat, '').strip()
         return clean_title_from_summary(title), date_str
@@ -411,6 +553,15 @@ def parse_anthropic_article_text(text, categories):
     return title, date_str
 
 
+# Boundaries between a title and the summary run into it: a version number
+# followed by a sentence opener, or a lowercase-to-Capitalized word join.
+# Titles are capped at MAX_TITLE_SCAN characters so scraped text can't make
+# the lazy scans backtrack over the whole string.
+MAX_TITLE_SCAN = 120
+VERSION_SUMMARY_RE = re.compile(rf'^(.{{1,{MAX_TITLE_SCAN}}}?\d+\.?\d*)(The |A |An |It |This |We |Our )')
+CAMEL_BOUNDARY_RE = re.compile(rf'^(.{{1,{MAX_TITLE_SCAN}}}?[a-z])([A-Z][a-z])')
+TRAILING_WORD_RE = re.compile(r'\b\w+$')
+
 def clean_title_from_summary(text):
     """Separate title from appended summary text.
 
@@ -423,31 +574,40 @@ def clean_title_from_summary(text):
 
     # Pattern 1: Title ends with version number, summary starts with "The/A/An"
     # e.g., "...4.5The best..." -> "...4.5"
-    match = re.search(r'^(.+?\d+\.?\d*)(The |A |An |It |This |We |Our )', text)
+    match = VERSION_SUMMARY_RE.search(text)
     if match:
         return match.group(1).strip()
 
     # Pattern 2: Title ends with word, then uppercase word without space starts summary
     # e.g., "...productivityServiceNow expanded..." -> look for CamelCase boundary
     # Find where a lowercase letter is immediately followed by uppercase (title|Summary boundary)
-    match = re.search(r'^(.+?[a-z])([A-Z][a-z])', text)
+    match = CAMEL_BOUNDARY_RE.search(text)
     if match and len(match.group(1)) > 15:
         potential_title = match.group(1)
         # Verify this looks like a complete title (not mid-word)
         # Should end with a complete word
-        if re.search(r'\b\w+$', potential_title):
+        if TRAILING_WORD_RE.search(potential_title):
             return potential_title.strip()
 
     # Pattern 3: Title contains repeated key phrase (title repeated in summary)
     # e.g., "Introducing Claude Haiku 4.5Claude Haiku 4.5 matches..."
     words = text.split()
     if len(words) > 6:
+        # Lowercase once, and note where each word starts in the joined
+        # text so "the rest" is just a search offset rather than a new string
+        lower_words = [word.lower() for word in words]
+        lower_text = ' '.join(lower_words)
+        word_starts = []
+        offset = 0
+        for word in lower_words:
+            word_starts.append(offset)
+            offset += len(word) + 1
+
         # Look for 2-3 word phrase that repeats
         for phrase_len in [3, 2]:
             for i in range(len(words) - phrase_len * 2):
-                phrase = ' '.join(words[i:i+phrase_len])
-                rest = ' '.join(words[i+phrase_len:])
-                if phrase.lower() in rest.lower():
+                phrase = ' '.join(lower_words[i:i+phrase_len])
+                if lower_text.find(phrase, word_starts[i+phrase_len]) != -1:
                     # Found repeat - title is up to first occurrence
                     return ' '.join(words[:i+phrase_len]).strip()
 
@@ -464,48 +624,56 @@ def clean_title_from_summary(text):
 
     return text
 
-def scrape_meta_ai_blog():
-    """Scrape AI-specific posts from Meta's AI blog."""
+# Blog post links on the Meta AI blog
+BLOG_HREF_RE = re.compile(r"/blog/")
+
+def parse_meta_ai_posts(response):
+    """Parse blog post links from the Meta AI blog page."""
     posts = []
-    url = "https://ai.meta.com/blog/"
+    # Only build the blog post links; the rest of the page is never used
+    soup = BeautifulSoup(response.content, "lxml", parse_only=SoupStrainer("a", href=BLOG_HREF_RE))
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; AI-Weather-Report/1.0)"
-        }
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+    # Find blog post links
+    articles = soup.find_all("a", href=BLOG_HREF_RE)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    seen_urls = set()
+    for article in articles:
+        link_url = article.get("href", "")
+        if not link_url.startswith("http"):
+            link_url = f"https://ai.meta.com{link_url}"
 
-        # Find blog post links
-        articles = soup.find_all("a", href=re.compile(r"/blog/"))
+        if link_url in seen_urls:
+            continue
+        seen_urls.add(link_url)
 
-        seen_urls = set()
-        for article in articles:
-            link_url = article.get("href", "")
-            if not link_url.startswith("http"):
-                link_url = f"https://ai.meta.com{link_url}"
+        title_elem = article.find(["h2", "h3", "h4"]) or article
+        title = title_elem.get_text(strip=True) if title_elem else ""
 
-            if link_url in seen_urls:
-                continue
-            seen_urls.add(link_url)
+        if not title or len(title) < 5:
+            continue
 
-            title_elem = article.find(["h2", "h3", "h4"]) or article
-            title = title_elem.get_text(strip=True) if title_elem else ""
+        posts.append({
+            "title": title,
+            "date": "",
+            "url": link_url,
+            "summary": "",
+        })
 
-            if not title or len(title) < 5:
-                continue
+        if len(posts) >= 30:
+            break
 
-            posts.append({
-                "title": title,
-                "date": "",
-                "url": link_url,
-                "summary": "",
-            })
+    return posts
 
-            if len(posts) >= 30:
-                break
+def scrape_meta_ai_blog():
+    """Scrape AI-specific posts from Meta's AI blog."""
+    posts = []
+    url = "https://ai.meta.com/blog/"
+
+    try:
+        headers = {
+            "User-Agent": "Mozilla/5.0 (compatible; AI-Weather-Report/1.0)"
+        }
+        posts = fetch_cached(url, parse_meta_ai_posts, headers)
 
         print(f"Scraped {len(posts)} posts from Meta AI blog")
 
@@ -518,8 +686,7 @@ def load_existing_data(filepath):
     """Load existing mood data file if it exists."""
     if filepath.exists():
         try:
-            with open(filepath) as f:
-                return json.load(f)
+            return orjson.loads(filepath.read_bytes())
         except Exception:
             pass
     return None
@@ -541,8 +708,7 @@ def save_mood_data(company_id, name, posts, output_dir):
         "history": history,
     }
 
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     print(f"Saved mood data to {filepath}")
 
@@ -554,30 +720,33 @@ def main():
 
     print("Fetching blog/news feeds...")
 
-    for company_id, source in SOURCES.items():
-        if source["type"] == "rss":
-            posts = fetch_rss_feed(source)
-        elif company_id == "anthropic":
-            posts = scrape_anthropic_news()
-
-        save_mood_data(company_id, source["name"], posts, output_dir)
-
-    # Also scrape Meta AI blog for additional AI-specific content
-    meta_ai_posts = scrape_meta_ai_blog()
+    # Fetch all sources, plus the Meta AI blog, in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for company_id, source in SOURCES.items():
+            if source["type"] == "rss":
+                futures[company_id] = executor.submit(fetch_rss_feed, source)
+            elif company_id == "anthropic":
+                futures[company_id] = executor.submit(scrape_anthropic_news)
+        meta_ai_future = executor.submit(scrape_meta_ai_blog)
+
+    for company_id, future in futures.items():
+        save_mood_data(company_id, SOURCES[company_id]["name"], future.result(), output_dir)
+
+    # Also merge in the Meta AI blog for additional AI-specific content
+    meta_ai_posts = meta_ai_future.result()
     if meta_ai_posts:
         # Merge with existing Meta posts
         meta_path = output_dir / "meta.json"
         if meta_path.exists():
-            with open(meta_path) as f:
-                meta_data = json.load(f)
+            meta_data = orjson.loads(meta_path.read_bytes())
             # Add unique posts from AI blog
             existing_urls = {p["url"] for p in meta_data.get("posts", [])}
             for post in meta_ai_posts:
                 if post["url"] not in existing_urls:
                     meta_data["posts"].insert(0, post)
             meta_data["posts"] = meta_data["posts"][:10]
-            with open(meta_path, 'w') as f:
-                json.dump(meta_data, f, indent=2)
+            meta_path.write_bytes(orjson.dumps(meta_data, option=orjson.OPT_INDENT_2))
 
     print("Feed fetching complete!")
 
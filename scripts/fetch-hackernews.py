@@ -5,12 +5,15 @@ Tracks story count, total points, frontpage hits, and calculates sentiment.
 Outputs to data/buzz/hackernews.json
 """
 
-import json
+import heapq
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from urllib.request import urlopen
-from urllib.parse import urlencode, quote_plus
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 
 # Search terms for each company
 COMPANY_SEARCH_TERMS = {
@@ -20,20 +23,31 @@ COMPANY_SEARCH_TERMS = {
     "meta": ["meta ai", "llama 2", "llama 3", "meta llama", "facebook ai"],
 }
 
-# Positive/negative word lists for simple sentiment
-POSITIVE_WORDS = [
+# Searches run concurrently; the work is network-bound
+MAX_WORKERS = 8
+
+# Shared session so every search reuses pooled connections to Algolia; sized
+# for all companies' searches in flight at once
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS * len(COMPANY_SEARCH_TERMS)))
+
+# Positive/negative word sets for simple sentiment
+POSITIVE_WORDS = frozenset([
     "amazing", "awesome", "best", "brilliant", "breakthrough", "excellent",
     "fantastic", "great", "impressive", "incredible", "innovative", "love",
     "revolutionary", "superb", "wonderful", "exciting", "powerful", "fast",
     "better", "improved", "success", "winning", "leading", "advanced"
-]
+])
 
-NEGATIVE_WORDS = [
+NEGATIVE_WORDS = frozenset([
     "bad", "broken", "bug", "crash", "disappointing", "fail", "failure",
     "hate", "horrible", "issue", "leak", "lawsuit", "problem", "scam",
     "slow", "terrible", "unsafe", "vulnerability", "warning", "worse",
     "concern", "dangerous", "risk", "scary", "worried", "layoff", "fired"
-]
+])
+
+# Words in a lowercased title
+WORD_RE = re.compile(r'\b\w+\b')
 
 
 def fetch_hn_search(query, days_back=7):
@@ -45,19 +59,20 @@ def fetch_hn_search(query, days_back=7):
     cutoff_date = datetime.utcnow() - timedelta(days=days_back)
     cutoff_timestamp = int(cutoff_date.timestamp())
 
-    # Build API URL
+    # Build API query
     params = {
         "query": query,
         "tags": "story",
         "numericFilters": f"created_at_i>{cutoff_timestamp}",
         "hitsPerPage": 100,
     }
-    url = f"https://hn.algolia.com/api/v1/search?{urlencode(params, quote_via=quote_plus)}"
+    url = "https://hn.algolia.com/api/v1/search"
 
     try:
-        with urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode())
-            return data.get("hits", [])
+        response = SESSION.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data.get("hits", [])
     except Exception as e:
         print(f"Error fetching HN data for '{query}': {e}")
         return []
@@ -72,10 +87,13 @@ def calculate_title_sentiment(title):
         return 0.0
 
     title_lower = title.lower()
-    words = re.findall(r'\b\w+\b', title_lower)
 
-    positive_count = sum(1 for word in words if word in POSITIVE_WORDS)
-    negative_count = sum(1 for word in words if word in NEGATIVE_WORDS)
+    positive_count = negative_count = 0
+    for word in WORD_RE.findall(title_lower):
+        if word in POSITIVE_WORDS:
+            positive_count += 1
+        elif word in NEGATIVE_WORDS:
+            negative_count += 1
 
     total = positive_count + negative_count
     if total == 0:
@@ -90,31 +108,36 @@ def fetch_company_data(company_id, search_terms, days_back=7):
     """
     all_stories = {}  # Use dict to dedupe by objectID
 
-    for term in search_terms:
-        stories = fetch_hn_search(term, days_back)
+    # Run the searches in parallel; results come back in search term order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(lambda term: fetch_hn_search(term, days_back), search_terms))
+
+    for stories in results:
         for story in stories:
             story_id = story.get("objectID")
             if story_id and story_id not in all_stories:
                 all_stories[story_id] = story
 
-    # Aggregate metrics
+    # Aggregate metrics in one pass over the stories
     stories_list = list(all_stories.values())
-    total_points = sum(s.get("points", 0) or 0 for s in stories_list)
-    total_comments = sum(s.get("num_comments", 0) or 0 for s in stories_list)
+    total_points = total_comments = frontpage_hits = 0
+    sentiments = []
+    for story in stories_list:
+        points = story.get("points", 0) or 0
+        total_points += points
+        total_comments += story.get("num_comments", 0) or 0
+
+        # Count frontpage hits (stories with >100 points typically hit front page)
+        if points >= 100:
+            frontpage_hits += 1
 
-    # Count frontpage hits (stories with >100 points typically hit front page)
-    frontpage_hits = sum(1 for s in stories_list if (s.get("points", 0) or 0) >= 100)
+        # Sentiment from the title
+        sentiments.append(calculate_title_sentiment(story.get("title", "")))
 
-    # Calculate average sentiment from titles
-    sentiments = [calculate_title_sentiment(s.get("title", "")) for s in stories_list]
     avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0.0
 
-    # Get top stories for reference
-    top_stories = sorted(
-        stories_list,
-        key=lambda s: (s.get("points", 0) or 0),
-        reverse=True
-    )[:5]
+    # Get top stories for reference; nlargest keeps sorted()'s order for ties
+    top_stories = heapq.nlargest(5, stories_list, key=lambda s: (s.get("points", 0) or 0))
 
     return {
         "stories_7d": len(stories_list),
@@ -146,11 +169,17 @@ def main():
 
     print("Fetching HackerNews data...")
 
+    # Fetch all companies in parallel
+    with ThreadPoolExecutor(max_workers=len(COMPANY_SEARCH_TERMS)) as executor:
+        futures = {
+            company_id: executor.submit(fetch_company_data, company_id, search_terms)
+            for company_id, search_terms in COMPANY_SEARCH_TERMS.items()
+        }
+
     companies_data = {}
-    for company_id, search_terms in COMPANY_SEARCH_TERMS.items():
-        print(f"  Fetching data for {company_id}...")
-        companies_data[company_id] = fetch_company_data(company_id, search_terms)
-        print(f"    Found {companies_data[company_id]['stories_7d']} stories, "
+    for company_id, future in futures.items():
+        companies_data[company_id] = future.result()
+        print(f"  {company_id}: found {companies_data[company_id]['stories_7d']} stories, "
               f"{companies_data[company_id]['total_points']} points")
 
     result = {
@@ -159,9 +188,9 @@ def main():
     }
 
     # Save to both locations
+    output = orjson.dumps(result, option=orjson.OPT_INDENT_2)
     for output_path in [output_dir / "hackernews.json", local_output_dir / "hackernews.json"]:
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2)
+        output_path.write_bytes(output)
         print(f"Saved HN data to {output_path}")
 
     print("HackerNews data fetch complete!")
@@ -20,16 +20,56 @@ TICKERS = {
     "NVDA": "NVIDIA",       # Industry bellwether
 }
 
+# Stock records from the last fetch; re-runs within the TTL reuse them
+# instead of downloading the same month of history again
+STOCK_CACHE_PATH = Path(__file__).parent.parent / "data" / "pressure" / ".stocks_cache.json"
+STOCK_CACHE_TTL = timedelta(hours=1)
+
+def load_stock_cache():
+    """Return cached stock records if they're fresh and cover TICKERS, else None."""
+    try:
+        with open(STOCK_CACHE_PATH) as f:
+            cache = json.load(f)
+        fetched_at = datetime.fromisoformat(cache["fetchedAt"])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+        return None
+
+    if cache.get("tickers") != list(TICKERS):
+        return None
+    if datetime.utcnow() - fetched_at > STOCK_CACHE_TTL:
+        return None
+    return cache["stocks"]
+
+def save_stock_cache(stocks):
+    """Record freshly fetched stock records for later re-runs."""
+    STOCK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(STOCK_CACHE_PATH, 'w') as f:
+        json.dump({
+            "fetchedAt": datetime.utcnow().isoformat(),
+            "tickers": list(TICKERS),
+            "stocks": stocks,
+        }, f)
+
 def fetch_stock_data():
     """Fetch current stock data and recent history for all tickers."""
+    cached = load_stock_cache()
+    if cached is not None:
+        print(f"Reusing {len(cached)} recently fetched stocks from cache")
+        return cached
+
+    # Get last 30 days of history for sparklines, in one batched request
+    # for all tickers instead of one per ticker
+    try:
+        data = yf.download(list(TICKERS), period="1mo", group_by="ticker", threads=True, progress=False)
+    except Exception as e:
+        print(f"Error fetching stock data: {e}")
+        return []
+
     stocks = []
 
     for ticker, name in TICKERS.items():
         try:
-            stock = yf.Ticker(ticker)
-
-            # Get last 30 days of history for sparkline
-            hist = stock.history(period="1mo")
+            hist = data[ticker].dropna(how="all")
 
             if hist.empty:
                 print(f"Warning: No data for {ticker}")
@@ -44,7 +84,7 @@ def fetch_stock_data():
             change_percent = round((change / prev['Close']) * 100, 2)
 
             # Extract closing prices for history (last 30 days)
-            history = [round(p, 2) for p in hist['Close'].tolist()]
+            history = hist['Close'].round(2).tolist()
 
             stocks.append({
                 "ticker": ticker,
@@ -60,6 +100,9 @@ def fetch_stock_data():
         except Exception as e:
             print(f"Error fetching {ticker}: {e}")
 
+    # Only cache a complete batch, so a ticker that failed is retried next run
+    if len(stocks) == len(TICKERS):
+        save_stock_cache(stocks)
     return stocks
 
 def main():
@@ -71,6 +114,17 @@ def main():
     print(f"Fetching stock data...")
     stocks = fetch_stock_data()
 
+    # Skip the write if the stocks haven't changed, so lastUpdated only
+    # moves when the data does
+    try:
+        with open(output_path) as f:
+            existing = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        existing = None
+    if existing and existing.get("stocks") == stocks:
+        print(f"Unchanged stock data in {output_path}")
+        return
+
     data = {
         "lastUpdated": datetime.utcnow().isoformat() + "Z",
         "stocks": stocks,
@@ -79,9 +133,12 @@ def main():
     # Ensure directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to file
-    with open(output_path, 'w') as f:
+    # Write to a temp file and rename over the original so readers
+    # never see a half-written file
+    tmp_path = output_path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w') as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp_path, output_path)
 
     print(f"Saved stock data to {output_path}")
 
@@ -0,0 +1,63 @@
+"""
+Tests for scripts/fetch-changelogs.py.
+Run with: python -m unittest discover -s tests -p "test_*.py"
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "fetch-changelogs.py"
+
+spec = importlib.util.spec_from_file_location("fetch_changelogs", SCRIPT_PATH)
+fetch_changelogs = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fetch_changelogs)
+
+
+def fake_response(html):
+    """Build a 200 response with the given HTML body."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = html.encode()
+    response.encoding = "utf-8"
+    return response
+
+
+class ScrapeGoogleChangelogTest(unittest.TestCase):
+    def scrape(self, html):
+        with mock.patch.object(fetch_changelogs.SESSION, "get", return_value=fake_response(html)):
+            releases = fetch_changelogs.scrape_google_changelog()
+        return [(r["date"], r["title"]) for r in releases]
+
+    def test_title_comes_from_first_list_item_or_paragraph(self):
+        html = """<html><body>
+            <h2>June 3, 2024</h2>
+            <ul><li>Released gemini-1.5-pro-002</li><li>Other change</li></ul>
+            <h3>2024-05-01</h3>
+            <p>Deprecated old model</p>
+        </body></html>"""
+        self.assertEqual(self.scrape(html), [
+            ("2024-06-03", "Released gemini-1.5-pro-002"),
+            ("2024-05-01", "Deprecated old model"),
+        ])
+
+    def test_heading_without_body_keeps_its_own_text(self):
+        html = """<html><body>
+            <h2>2025-01-05</h2>
+            <div><span>text only</span></div>
+            <h2>2025-01-01 Heading without body</h2>
+            <h2>2024-12-01</h2>
+            <p>Later para</p>
+        </body></html>"""
+        self.assertEqual(self.scrape(html), [
+            ("2025-01-05", "text only"),
+            ("2025-01-01", "2025-01-01 Heading without body"),
+            ("2024-12-01", "Later para"),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
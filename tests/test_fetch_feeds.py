@@ -0,0 +1,71 @@
+"""
+Tests for scripts/fetch-feeds.py.
+Run with: python -m unittest discover -s tests -p "test_*.py"
+"""
+
+import importlib.util
+import json
+import unittest
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "fetch-feeds.py"
+
+spec = importlib.util.spec_from_file_location("fetch_feeds", SCRIPT_PATH)
+fetch_feeds = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fetch_feeds)
+
+
+def inline_page(posts):
+    """Wrap posts in an inline JSON script like the Anthropic news page."""
+    payload = json.dumps({"posts": posts})
+    return (
+        '<html><body>\n<p>Don"t miss our latest news</p>\n'
+        f'<script type="application/json">{payload}</script>\n</body></html>'
+    )
+
+
+class ExtractPostsFromNextjsDataTest(unittest.TestCase):
+    def extract(self, posts):
+        return [
+            (post["title"], post["date"], post["url"])
+            for post in fetch_feeds.extract_posts_from_nextjs_data(inline_page(posts))
+        ]
+
+    def test_dates_pair_with_their_own_post_in_any_key_order(self):
+        posts = [
+            {"title": "Post title number one", "slug": {"current": "one"},
+             "publishedOn": "2025-01-01T00:00:00Z"},
+            {"publishedOn": "2025-02-02T00:00:00Z", "slug": {"_type": "slug", "current": "two"},
+             "title": "Post title number two"},
+            {"title": "Undated post title", "slug": {"current": "three"}},
+            {"slug": {"current": "four"}, "publishedOn": "2025-04-04T00:00:00Z",
+             "title": "Post title number four"},
+        ]
+        self.assertEqual(self.extract(posts), [
+            ("Post title number one", "2025-01-01", "https://www.anthropic.com/news/one"),
+            ("Post title number two", "2025-02-02", "https://www.anthropic.com/news/two"),
+            ("Undated post title", "", "https://www.anthropic.com/news/three"),
+            ("Post title number four", "2025-04-04", "https://www.anthropic.com/news/four"),
+        ])
+
+    def test_markup_inside_string_values(self):
+        posts = []
+        for i in range(6):
+            post = {}
+            if i % 2:
+                post["excerpt"] = "Use x > y, or read <b>more</b> here"
+            post.update({
+                "title": f"Post title number {i}",
+                "slug": {"current": f"post-{i}"},
+                "publishedOn": f"2025-03-0{i + 1}T00:00:00Z",
+            })
+            posts.append(post)
+
+        self.assertEqual(self.extract(posts), [
+            (f"Post title number {i}", f"2025-03-0{i + 1}", f"https://www.anthropic.com/news/post-{i}")
+            for i in range(6)
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()